@@ -70,7 +70,12 @@ def _prepare_dxf_layers(
     layer_names_by_handle: dict[int, str] | None = None,
 ) -> dict[int, str]:
     mapping: dict[int, str] = {0: "0"}
-    for handle in sorted(layer_styles_by_handle):
+    layers = dxf_doc.layers
+    # Many layers share one color profile; resolve each profile once.
+    # Table.new() stores name/owner into the attribs it is given, so every
+    # layer gets its own copy of the shared profile.
+    attribs_by_style: dict[tuple[int, int | None], dict[str, Any]] = {}
+    for handle, style in sorted(layer_styles_by_handle.items()):
         if handle <= 0:
             continue
         fallback_name = f"LAYER_{handle:X}"
@@ -79,24 +84,25 @@ def _prepare_dxf_layers(
             candidate = layer_names_by_handle.get(handle)
             if isinstance(candidate, str) and _is_valid_dxf_layer_name(candidate):
                 name = candidate.strip()
-        dxfattribs: dict[str, Any] = {}
-        style = layer_styles_by_handle.get(handle)
-        if style is not None:
+        profile = attribs_by_style.get(style)
+        if profile is None:
+            profile = {}
             index, true_color = style
             color = _to_valid_aci(index)
             if color is not None:
-                dxfattribs["color"] = color
+                profile["color"] = color
             resolved_true = _to_valid_true_color(true_color)
             if resolved_true is not None:
-                dxfattribs["true_color"] = resolved_true
-        if name not in dxf_doc.layers:
+                profile["true_color"] = resolved_true
+            attribs_by_style[style] = profile
+        if name not in layers:
             try:
-                dxf_doc.layers.new(name=name, dxfattribs=dxfattribs or None)
+                layers.new(name=name, dxfattribs=dict(profile) or None)
             except Exception:
                 name = fallback_name
-                if name not in dxf_doc.layers:
+                if name not in layers:
                     try:
-                        dxf_doc.layers.new(name=name, dxfattribs=dxfattribs or None)
+                        layers.new(name=name, dxfattribs=dict(profile) or None)
                     except Exception:
                         continue
         mapping[handle] = name
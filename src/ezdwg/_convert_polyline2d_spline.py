@@ -1,28 +1,42 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
-from ._convert_utils import _point3
+from ._convert_utils import _points3
 
-_POLYLINE_2D_SPLINE_CURVE_TYPES = {"QuadraticBSpline", "CubicBSpline", "Bezier"}
+_POLYLINE_2D_SPLINE_CURVE_TYPES = frozenset({"QuadraticBSpline", "CubicBSpline", "Bezier"})
+_POLYLINE_2D_CUBIC_CURVE_TYPES = frozenset({"CubicBSpline", "Bezier"})
+_FULL_TURN_RADIANS_TOLERANCE = 2.0 * math.pi + 1.0e-3
 
 
 def _should_write_polyline_2d_as_spline(dxf: dict[str, Any]) -> bool:
     if bool(dxf.get("interpolation_applied", False)):
-        return len(list(dxf.get("interpolated_points", []) or [])) >= 2
+        return _has_at_least_two(dxf.get("interpolated_points"))
     if bool(dxf.get("curve_fit", False)) or bool(dxf.get("spline_fit", False)):
-        return len(list(dxf.get("points", []) or [])) >= 2
+        return _has_at_least_two(dxf.get("points"))
     curve_type_label = str(dxf.get("curve_type_label") or "")
     if curve_type_label in _POLYLINE_2D_SPLINE_CURVE_TYPES:
-        return len(list(dxf.get("points", []) or [])) >= 2
+        return _has_at_least_two(dxf.get("points"))
     return False
 
 
+def _has_at_least_two(values: Any) -> bool:
+    if not values:
+        return False
+    try:
+        return len(values) >= 2
+    except TypeError:
+        # Non-sized iterables only need to yield two items.
+        return sum(1 for _ in islice(values, 2)) >= 2
+
+
 def _polyline_2d_spline_points(dxf: dict[str, Any]) -> list[tuple[float, float, float]]:
     points = _polyline_2d_select_curve_points(dxf)
     if len(points) < 2 and bool(dxf.get("interpolation_applied", False)):
-        points = [_point3(point) for point in list(dxf.get("interpolated_points") or [])]
+        points = _points3(dxf.get("interpolated_points") or [])
     if len(points) < 2:
         return points
     closed = bool(dxf.get("closed", False))
@@ -39,7 +53,7 @@ def _polyline_2d_spline_degree(dxf: dict[str, Any], point_count: int) -> int:
     label = str(dxf.get("curve_type_label") or "")
     if label == "QuadraticBSpline":
         preferred = 2
-    elif label in {"CubicBSpline", "Bezier"}:
+    elif label in _POLYLINE_2D_CUBIC_CURVE_TYPES:
         preferred = 3
     else:
         preferred = int(dxf.get("degree", 3))
@@ -66,13 +80,13 @@ def _polyline_2d_spline_payload(dxf: dict[str, Any]) -> dict[str, Any] | None:
         control_points = list(spline_points)
         if len(control_points) >= 2:
             if len(control_points) > 1 and control_points[0] == control_points[-1]:
-                control_points = control_points[:-1]
+                control_points.pop()
             if len(control_points) >= 2:
                 degree = max(2, min(spline_degree, max(2, len(control_points) - 1)))
                 return {
                     "control_points": control_points,
                     "degree": degree,
-                    "knots": _open_uniform_knot_vector(len(control_points), degree),
+                    "knots": _open_uniform_knot_tuple(len(control_points), degree),
                     "closed": bool(dxf.get("closed", False)),
                 }
 
@@ -86,14 +100,17 @@ def _polyline_2d_spline_payload(dxf: dict[str, Any]) -> dict[str, Any] | None:
 
 
 def _open_uniform_knot_vector(control_point_count: int, degree: int) -> list[float]:
-    n = int(control_point_count)
-    p = int(degree)
+    return list(_open_uniform_knot_tuple(int(control_point_count), int(degree)))
+
+
+@lru_cache(maxsize=256)
+def _open_uniform_knot_tuple(n: int, p: int) -> tuple[float, ...]:
     if n < 2:
-        return []
+        return ()
     p = max(1, min(p, n - 1))
     knot_count = n + p + 1
     if knot_count <= 0:
-        return []
+        return ()
 
     knots: list[float] = []
     for i in range(knot_count):
@@ -103,14 +120,18 @@ def _open_uniform_knot_vector(control_point_count: int, degree: int) -> list[flo
             knots.append(1.0)
         else:
             knots.append((i - p) / (n - p))
-    return knots
+    return tuple(knots)
 
 
 def _polyline_2d_select_curve_points(dxf: dict[str, Any]) -> list[tuple[float, float, float]]:
-    points = [_point3(point) for point in list(dxf.get("points") or [])]
+    points = _points3(dxf.get("points") or [])
     if len(points) < 2:
         return points
     indices = _polyline_2d_select_curve_indices(dxf, len(points))
+    # Indices are an increasing subset of range(len(points)); a full-length
+    # selection is every point, so the bulk-converted list is reused as is.
+    if len(indices) == len(points):
+        return points
     return [points[i] for i in indices]
 
 
@@ -118,24 +139,17 @@ def _polyline_2d_select_curve_indices(dxf: dict[str, Any], point_count: int) ->
     if point_count < 2:
         return list(range(point_count))
 
-    vertex_flags_raw = list(dxf.get("vertex_flags") or [])
-    if not vertex_flags_raw:
-        return list(range(point_count))
-
-    vertex_flags = [int(flag) for flag in vertex_flags_raw]
-    count = min(point_count, len(vertex_flags))
-    if count < 2:
+    # Flags past the last point are never selected, so only those are parsed.
+    vertex_flags = [int(flag) for flag in islice(dxf.get("vertex_flags") or (), point_count)]
+    if len(vertex_flags) < 2:
         return list(range(point_count))
 
-    paired = [(i, vertex_flags[i]) for i in range(count)]
-    has_spline_frame = any((flag & 0x10) != 0 for _, flag in paired)
-    if has_spline_frame:
-        selected = [idx for idx, flag in paired if (flag & 0x10) != 0]
-        if len(selected) >= 2:
-            return selected
+    selected = [idx for idx, flag in enumerate(vertex_flags) if flag & 0x10]
+    if len(selected) >= 2:
+        return selected
 
     # Exclude curve/spline generated vertices (DXF vertex flags bit1/bit8).
-    selected = [idx for idx, flag in paired if (flag & 0x09) == 0]
+    selected = [idx for idx, flag in enumerate(vertex_flags) if not flag & 0x09]
     if len(selected) >= 2:
         return selected
     return list(range(point_count))
@@ -145,19 +159,19 @@ def _polyline_2d_spline_tangents(dxf: dict[str, Any]) -> list[tuple[float, float
     if bool(dxf.get("closed", False)):
         return None
 
-    points = list(dxf.get("points") or [])
-    if len(points) < 2:
+    point_count = len(dxf.get("points") or ())
+    if point_count < 2:
         return None
-    indices = _polyline_2d_select_curve_indices(dxf, len(points))
+    indices = _polyline_2d_select_curve_indices(dxf, point_count)
     if len(indices) < 2:
         return None
 
-    tangent_dirs = list(dxf.get("tangent_dirs") or [])
-    vertex_flags = [int(flag) for flag in list(dxf.get("vertex_flags") or [])]
+    tangent_dirs = dxf.get("tangent_dirs") or ()
+    vertex_flags = [int(flag) for flag in dxf.get("vertex_flags") or []]
     if not tangent_dirs or not vertex_flags:
         return None
 
-    limit = min(len(points), len(vertex_flags), len(tangent_dirs))
+    limit = min(point_count, len(vertex_flags), len(tangent_dirs))
     if limit < 2:
         return None
 
@@ -198,19 +212,14 @@ def _polyline_2d_spline_tangents(dxf: dict[str, Any]) -> list[tuple[float, float
 
 
 def _polyline_2d_tangent_angle_unit(raw_angles: list[Any]) -> str:
-    finite: list[float] = []
+    # Most DWG data stores radians. Values clearly beyond one full turn
+    # indicate degree-like data from upstream conversion quirks, so the scan
+    # stops at the first such finite value (NaN never compares greater).
     for raw in raw_angles:
         try:
             value = float(raw)
         except Exception:
             continue
-        if math.isfinite(value):
-            finite.append(value)
-    if not finite:
-        return "rad"
-    max_abs = max(abs(value) for value in finite)
-    # Most DWG data stores radians. Values clearly beyond one full turn
-    # indicate degree-like data from upstream conversion quirks.
-    if max_abs > (2.0 * math.pi + 1.0e-3):
-        return "deg"
+        if abs(value) > _FULL_TURN_RADIANS_TOLERANCE and math.isfinite(value):
+            return "deg"
     return "rad"
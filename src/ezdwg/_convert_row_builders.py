@@ -4,10 +4,14 @@ import math
 
 from .entity import Entity
 
+# Same constant math.radians() multiplies by, so results are bit-identical.
+_DEG_TO_RAD = math.pi / 180.0
+
 
 def _as_line_row(entity: Entity) -> tuple[int, float, float, float, float, float, float] | None:
-    start = entity.dxf.get("start")
-    end = entity.dxf.get("end")
+    dxf = entity.dxf
+    start = dxf.get("start")
+    end = dxf.get("end")
     if not (
         isinstance(start, tuple)
         and len(start) == 3
@@ -27,8 +31,9 @@ def _as_line_row(entity: Entity) -> tuple[int, float, float, float, float, float
 
 
 def _as_point_row(entity: Entity) -> tuple[int, float, float, float, float] | None:
-    location = entity.dxf.get("location")
-    x_axis_angle = entity.dxf.get("x_axis_angle", 0.0)
+    dxf = entity.dxf
+    location = dxf.get("location")
+    x_axis_angle = dxf.get("x_axis_angle", 0.0)
     if not (
         isinstance(location, tuple)
         and len(location) == 3
@@ -45,8 +50,9 @@ def _as_point_row(entity: Entity) -> tuple[int, float, float, float, float] | No
 
 
 def _as_ray_row(entity: Entity) -> tuple[int, tuple[float, float, float], tuple[float, float, float]] | None:
-    start = entity.dxf.get("start")
-    unit_vector = entity.dxf.get("unit_vector")
+    dxf = entity.dxf
+    start = dxf.get("start")
+    unit_vector = dxf.get("unit_vector")
     if not (
         isinstance(start, tuple)
         and len(start) == 3
@@ -61,15 +67,16 @@ def _as_ray_row(entity: Entity) -> tuple[int, tuple[float, float, float], tuple[
     )
 
 
-def _as_xline_row(entity: Entity) -> tuple[int, tuple[float, float, float], tuple[float, float, float]] | None:
-    return _as_ray_row(entity)
+# XLINE rows share the RAY layout; alias instead of adding a call frame.
+_as_xline_row = _as_ray_row
 
 
 def _as_arc_row(entity: Entity) -> tuple[int, float, float, float, float, float, float] | None:
-    center = entity.dxf.get("center")
-    radius = entity.dxf.get("radius")
-    start_angle = entity.dxf.get("start_angle")
-    end_angle = entity.dxf.get("end_angle")
+    dxf = entity.dxf
+    center = dxf.get("center")
+    radius = dxf.get("radius")
+    start_angle = dxf.get("start_angle")
+    end_angle = dxf.get("end_angle")
     if not (
         isinstance(center, tuple)
         and len(center) == 3
@@ -84,14 +91,15 @@ def _as_arc_row(entity: Entity) -> tuple[int, float, float, float, float, float,
         float(center[1]),
         float(center[2]),
         float(radius),
-        math.radians(float(start_angle)),
-        math.radians(float(end_angle)),
+        start_angle * _DEG_TO_RAD,
+        end_angle * _DEG_TO_RAD,
     )
 
 
 def _as_circle_row(entity: Entity) -> tuple[int, float, float, float, float] | None:
-    center = entity.dxf.get("center")
-    radius = entity.dxf.get("radius")
+    dxf = entity.dxf
+    center = dxf.get("center")
+    radius = dxf.get("radius")
     if not (isinstance(center, tuple) and len(center) == 3 and isinstance(radius, (int, float))):
         return None
     return (
@@ -106,11 +114,12 @@ def _as_circle_row(entity: Entity) -> tuple[int, float, float, float, float] | N
 def _as_lwpolyline_row(
     entity: Entity,
 ) -> tuple[int, int, list[tuple[float, float]], list[float], list[tuple[float, float]], float | None] | None:
-    points = entity.dxf.get("points")
-    flags = entity.dxf.get("flags", 0)
-    bulges = entity.dxf.get("bulges") or []
-    widths = entity.dxf.get("widths") or []
-    const_width = entity.dxf.get("const_width")
+    dxf = entity.dxf
+    points = dxf.get("points")
+    flags = dxf.get("flags", 0)
+    bulges = dxf.get("bulges") or []
+    widths = dxf.get("widths") or []
+    const_width = dxf.get("const_width")
     if not isinstance(points, list):
         return None
     points2d: list[tuple[float, float]] = []
@@ -118,12 +127,12 @@ def _as_lwpolyline_row(
         if not (isinstance(point, tuple) and len(point) >= 2):
             return None
         points2d.append((float(point[0]), float(point[1])))
-    out_bulges = [float(value) for value in list(bulges)]
-    out_widths: list[tuple[float, float]] = []
-    for width in list(widths):
-        if not (isinstance(width, tuple) and len(width) == 2):
-            continue
-        out_widths.append((float(width[0]), float(width[1])))
+    out_bulges = [float(value) for value in bulges]
+    out_widths = [
+        (float(width[0]), float(width[1]))
+        for width in widths
+        if isinstance(width, tuple) and len(width) == 2
+    ]
     out_const_width = float(const_width) if isinstance(const_width, (int, float)) else None
     return (
         int(entity.handle),
@@ -136,10 +145,11 @@ def _as_lwpolyline_row(
 
 
 def _as_text_row(entity: Entity) -> tuple[int, str, tuple[float, float, float], float, float] | None:
-    text = entity.dxf.get("text")
-    insert = entity.dxf.get("insert")
-    height = entity.dxf.get("height")
-    rotation = entity.dxf.get("rotation", 0.0)
+    dxf = entity.dxf
+    text = dxf.get("text")
+    insert = dxf.get("insert")
+    height = dxf.get("height")
+    rotation = dxf.get("rotation", 0.0)
     if not (
         isinstance(text, str)
         and isinstance(insert, tuple)
@@ -153,18 +163,19 @@ def _as_text_row(entity: Entity) -> tuple[int, str, tuple[float, float, float],
         text,
         (float(insert[0]), float(insert[1]), float(insert[2])),
         float(height),
-        math.radians(float(rotation)),
+        rotation * _DEG_TO_RAD,
     )
 
 
 def _as_mtext_row(
     entity: Entity,
 ) -> tuple[int, str, tuple[float, float, float], tuple[float, float, float], float, float, int, int] | None:
-    text = entity.dxf.get("raw_text")
+    dxf = entity.dxf
+    text = dxf.get("raw_text")
     if not isinstance(text, str):
-        text = entity.dxf.get("text")
-    insert = entity.dxf.get("insert")
-    text_direction = entity.dxf.get("text_direction")
+        text = dxf.get("text")
+    insert = dxf.get("insert")
+    text_direction = dxf.get("text_direction")
     if not (
         isinstance(insert, tuple)
         and len(insert) == 3
@@ -179,14 +190,14 @@ def _as_mtext_row(
             float(text_direction[2]),
         )
     else:
-        rotation = float(entity.dxf.get("rotation", 0.0))
-        angle = math.radians(rotation)
+        rotation = float(dxf.get("rotation", 0.0))
+        angle = rotation * _DEG_TO_RAD
         direction = (math.cos(angle), math.sin(angle), 0.0)
 
-    rect_width = float(entity.dxf.get("rect_width", 0.0))
-    char_height = float(entity.dxf.get("char_height", entity.dxf.get("height", 1.0)))
-    attachment_point = int(entity.dxf.get("attachment_point", 1))
-    drawing_direction = int(entity.dxf.get("drawing_direction", 1))
+    rect_width = float(dxf.get("rect_width", 0.0))
+    char_height = float(dxf.get("char_height", dxf.get("height", 1.0)))
+    attachment_point = int(dxf.get("attachment_point", 1))
+    drawing_direction = int(dxf.get("drawing_direction", 1))
 
     return (
         int(entity.handle),
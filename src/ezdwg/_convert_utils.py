@@ -1,30 +1,38 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Any
 
 _MAX_COORD_ABS = 1.0e12
-_DIM_BLOCK_POLICIES = {"smart", "legacy"}
+_DIM_BLOCK_POLICIES = frozenset({"smart", "legacy"})
+_DIM_BLOCK_POLICY_DEFAULT_TOKENS = frozenset({"", "smart", "auto", "default"})
 
 
 def _to_valid_aci(value: Any) -> int | None:
-    try:
-        aci = int(value)
-    except Exception:
-        return None
-    if aci in (0, 256, 257):
-        return None
-    if 1 <= aci <= 255:
-        return aci
+    # Decoded colors are plain ints or None; only other values pay for int().
+    # 0 (BYBLOCK), 256 (BYLAYER) and 257 fall outside the valid 1..255 range.
+    if type(value) is not int:
+        if value is None:
+            return None
+        try:
+            value = int(value)
+        except Exception:
+            return None
+    if 1 <= value <= 255:
+        return value
     return None
 
 
 def _to_valid_true_color(value: Any) -> int | None:
-    try:
-        color = int(value) & 0xFFFFFF
-    except Exception:
-        return None
-    return color
+    if type(value) is not int:
+        if value is None:
+            return None
+        try:
+            value = int(value)
+        except Exception:
+            return None
+    return value & 0xFFFFFF
 
 
 def _to_rgb(true_color: int | None) -> tuple[int, int, int] | None:
@@ -39,6 +47,10 @@ def _to_rgb(true_color: int | None) -> tuple[int, int, int] | None:
 
 def _validate_coord(value: Any) -> float:
     coord = float(value)
+    # NaN and infinities never compare <= the limit, so one comparison covers
+    # the common valid case; the checks below only pick the error message.
+    if abs(coord) <= _MAX_COORD_ABS:
+        return coord
     if not math.isfinite(coord):
         raise ValueError(f"invalid coordinate value: {value!r}")
     if abs(coord) > _MAX_COORD_ABS:
@@ -51,20 +63,32 @@ def _finite_float(value: Any, default: float) -> float:
         parsed = float(value)
     except Exception:
         return float(default)
-    if not math.isfinite(parsed):
-        return float(default)
-    if abs(parsed) > _MAX_COORD_ABS:
-        return float(default)
-    return parsed
-
-
-def _distinct_xy_count(points: list[tuple[float, float, float]]) -> int:
-    return len({(float(point[0]), float(point[1])) for point in points})
+    if abs(parsed) <= _MAX_COORD_ABS:
+        return parsed
+    return float(default)
 
 
+def _distinct_xy_count(
+    points: list[tuple[float, float, float]],
+    *,
+    limit: int | None = None,
+) -> int:
+    if limit is None:
+        return len({(float(point[0]), float(point[1])) for point in points})
+    # Callers usually only need to know whether a polyline is degenerate, so
+    # stop hashing as soon as `limit` distinct points have been seen.
+    seen: set[tuple[float, float]] = set()
+    for point in points:
+        seen.add((float(point[0]), float(point[1])))
+        if len(seen) >= limit:
+            break
+    return len(seen)
+
+
+@lru_cache(maxsize=16)
 def _normalize_dim_block_policy(policy: str) -> str:
     token = str(policy or "").strip().lower()
-    if token in {"", "smart", "auto", "default"}:
+    if token in _DIM_BLOCK_POLICY_DEFAULT_TOKENS:
         return "smart"
     if token in _DIM_BLOCK_POLICIES:
         return token
@@ -72,11 +96,30 @@ def _normalize_dim_block_policy(policy: str) -> str:
     raise ValueError(f"unsupported dim-block policy: {policy!r} (expected one of: {allowed})")
 
 
+@lru_cache(maxsize=32)
+def _normalize_dimension_subtype(dimtype: str | None) -> str:
+    # Decoded subtypes come from a handful of names such as "DIM_LINEAR".
+    token = str(dimtype or "").upper()
+    if token.startswith("DIM_"):
+        return token[4:]
+    return token
+
+
 def _quantize_dim_block_value(value: float) -> float:
-    return round(float(value), 9)
+    # Snap to a 1e-9 grid. round() without ndigits stays on the C fast path,
+    # unlike round(value, 9), and the int product also folds -0.0 into 0.0.
+    scaled = float(value) * 1.0e9
+    try:
+        return round(scaled) * 1.0e-9
+    except (OverflowError, ValueError):
+        # inf and NaN have no grid point; keep them as-is.
+        return scaled
 
 
 def _normalized_angle_degrees(value: float) -> float:
+    if value == 0.0:
+        # Axis-aligned rotations dominate real drawings; skip the modulo.
+        return 0.0
     normalized = float(value) % 360.0
     if abs(normalized) <= 1.0e-9:
         return 0.0
@@ -86,6 +129,20 @@ def _normalized_angle_degrees(value: float) -> float:
 
 
 def _point3(value: Any) -> tuple[float, float, float]:
+    # Decoded rows almost always carry exact 3-tuples of plain floats; those
+    # are returned as-is after one fused range check per coordinate.
+    if type(value) is tuple and len(value) == 3:
+        x, y, z = value
+        limit = _MAX_COORD_ABS
+        if (
+            type(x) is float
+            and type(y) is float
+            and type(z) is float
+            and abs(x) <= limit
+            and abs(y) <= limit
+            and abs(z) <= limit
+        ):
+            return value
     if value is None:
         return (0.0, 0.0, 0.0)
     if isinstance(value, (list, tuple)):
@@ -104,7 +161,49 @@ def _point3(value: Any) -> tuple[float, float, float]:
     raise ValueError(f"invalid point value: {value!r}")
 
 
+def _points3(values: Any) -> list[tuple[float, float, float]]:
+    # Bulk variant of `_point3` for point lists. Each point gets a single
+    # fused range check; `_point3` is only re-run to raise its precise error.
+    # Exact float 3-tuples, the common decoded shape, are kept without
+    # rebuilding them.
+    limit = _MAX_COORD_ABS
+    points: list[tuple[float, float, float]] = []
+    append = points.append
+    for value in values:
+        if type(value) is tuple and len(value) == 3:
+            x, y, z = value
+            if (
+                type(x) is float
+                and type(y) is float
+                and type(z) is float
+                and abs(x) <= limit
+                and abs(y) <= limit
+                and abs(z) <= limit
+            ):
+                append(value)
+                continue
+        if isinstance(value, (list, tuple)) and len(value) >= 2:
+            try:
+                x = float(value[0])
+                y = float(value[1])
+                z = float(value[2]) if len(value) >= 3 else 0.0
+            except Exception:
+                x = y = z = math.nan
+            if abs(x) <= limit and abs(y) <= limit and abs(z) <= limit:
+                append((x, y, z))
+                continue
+        append(_point3(value))
+    return points
+
+
 def _point2(value: Any) -> tuple[float, float]:
+    # Same fast path as `_point3` for tuples of plain in-range floats.
+    if type(value) is tuple and len(value) >= 2:
+        x = value[0]
+        y = value[1]
+        limit = _MAX_COORD_ABS
+        if type(x) is float and type(y) is float and abs(x) <= limit and abs(y) <= limit:
+            return (x, y)
     if value is None:
         raise ValueError("invalid point value: None")
     if isinstance(value, (list, tuple)):
@@ -145,11 +244,13 @@ def _signed_line_distance_2d(
 ) -> float:
     dx = line_end[0] - line_start[0]
     dy = line_end[1] - line_start[1]
-    length = math.hypot(dx, dy)
-    if length <= 1.0e-12:
+    # Coordinates are bounded by _MAX_COORD_ABS, so the squared length cannot
+    # overflow and hypot's scaling is unnecessary.
+    squared_length = dx * dx + dy * dy
+    if squared_length <= 1.0e-24:
         return 0.0
     cross = dx * (point[1] - line_start[1]) - dy * (point[0] - line_start[0])
-    return cross / length
+    return cross / math.sqrt(squared_length)
 
 
 def _ordinate_dim_type(
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import math
+import struct
 import unicodedata
 import weakref
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 from . import raw
 from .document import (
@@ -26,11 +29,13 @@ from ._convert_utils import (
     _finite_float,
     _float_or_none,
     _normalize_dim_block_policy,
+    _normalize_dimension_subtype,
     _normalized_angle_degrees,
     _ordinate_dim_type,
     _point2,
     _point2_or_none,
     _point3,
+    _points3,
     _quantize_dim_block_value,
     _signed_line_distance_2d,
     _to_rgb,
@@ -70,30 +75,36 @@ from ._convert_geometry_filter import (
     _is_plausible_text_content,
     _is_plausible_text_insert,
 )
-_BLOCK_EXCLUDED_ENTITY_TYPES = {
-    "BLOCK",
-    "ENDBLK",
-    "SEQEND",
-    "VERTEX_2D",
-    "VERTEX_3D",
-    "VERTEX_MESH",
-    "VERTEX_PFACE",
-    "VERTEX_PFACE_FACE",
-}
-_VERTEX_SEQUENCE_ENTITY_TYPES = {
-    "VERTEX_2D",
-    "VERTEX_3D",
-    "VERTEX_MESH",
-    "VERTEX_PFACE",
-    "VERTEX_PFACE_FACE",
-    "SEQEND",
-}
-_POLYLINE_OWNER_TYPES = {
-    "POLYLINE_2D",
-    "POLYLINE_3D",
-    "POLYLINE_MESH",
-    "POLYLINE_PFACE",
-}
+_BLOCK_EXCLUDED_ENTITY_TYPES = frozenset(
+    {
+        "BLOCK",
+        "ENDBLK",
+        "SEQEND",
+        "VERTEX_2D",
+        "VERTEX_3D",
+        "VERTEX_MESH",
+        "VERTEX_PFACE",
+        "VERTEX_PFACE_FACE",
+    }
+)
+_VERTEX_SEQUENCE_ENTITY_TYPES = frozenset(
+    {
+        "VERTEX_2D",
+        "VERTEX_3D",
+        "VERTEX_MESH",
+        "VERTEX_PFACE",
+        "VERTEX_PFACE_FACE",
+        "SEQEND",
+    }
+)
+_POLYLINE_OWNER_TYPES = frozenset(
+    {
+        "POLYLINE_2D",
+        "POLYLINE_3D",
+        "POLYLINE_MESH",
+        "POLYLINE_PFACE",
+    }
+)
 _BLOCK_REFERENCE_ENTITY_TYPES = {"INSERT", "MINSERT", "DIMENSION"}
 _WRITABLE_ENTITY_TYPES = {
     "LINE",
@@ -149,6 +160,18 @@ _OPEN30_INNER_WIDTH = 23130.0
 _OPEN30_INNER_HEIGHT = 15720.0
 _OPEN30_SHEET_GAP = 1050.0
 _LAYOUT_PSEUDO_MODELSPACE_ALIAS_PREFIX = "__EZDWG_LAYOUT_ALIAS_MODEL_SPACE"
+# ezdxf point attributes sampled per entity type when estimating the local
+# extents of a block definition.
+_BLOCK_EXTENT_POINT_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "INSERT": ("insert",),
+    "MINSERT": ("insert",),
+    "LINE": ("start", "end"),
+    "POINT": ("location",),
+    "ARC": ("center",),
+    "CIRCLE": ("center",),
+    "TEXT": ("insert",),
+    "MTEXT": ("insert",),
+}
 
 
 @dataclass(frozen=True)
@@ -172,11 +195,14 @@ class WriteResult:
     skipped_by_type: dict[str, int]
 
 
+# (upper-cased block name, packed insert xyz + scale xyz + rotation)
+_DimensionBlockRefKey = tuple[str, bytes]
+_DIMENSION_BLOCK_REF_TRANSFORM = struct.Struct("<7d")
+
+
 @dataclass
 class _DimensionWriteContext:
-    written_block_refs: set[
-        tuple[str, tuple[float, float, float], tuple[float, float, float], float]
-    ] = field(default_factory=set)
+    written_block_refs: set[_DimensionBlockRefKey] = field(default_factory=set)
 
 
 @dataclass
@@ -187,6 +213,12 @@ class _ConvertDecodeCache:
     block_name_by_handle_cache: dict[tuple[str, ...] | None, dict[int, str]] = field(
         default_factory=dict
     )
+    object_header_rows: list[tuple[Any, ...]] | None = None
+    sorted_object_header_rows: list[tuple[Any, ...]] | None = None
+    entity_header_rows: list[tuple[int, int | None, str]] | None = None
+    block_handles_in_order: list[int] | None = None
+    modelspace_entity_handles: tuple[set[int], set[int]] | None = None
+    modelspace_entity_handles_resolved: bool = False
 
 
 def to_dwg(
@@ -229,81 +261,39 @@ def to_dwg(
         ]
     ] = []
 
+    row_writers: dict[str, tuple[Callable[[Any], Any], list[Any]]] = {
+        "LINE": (_as_line_row, line_rows),
+        "POINT": (_as_point_row, point_rows),
+        "RAY": (_as_ray_row, ray_rows),
+        "XLINE": (_as_xline_row, xline_rows),
+        "ARC": (_as_arc_row, arc_rows),
+        "CIRCLE": (_as_circle_row, circle_rows),
+        "LWPOLYLINE": (_as_lwpolyline_row, lwpolyline_rows),
+        "TEXT": (_as_text_row, text_rows),
+        "MTEXT": (_as_mtext_row, mtext_rows),
+    }
+
+    entities_by_type: dict[str, list[Entity]] = {}
     for entity in source_entities:
-        total += 1
-        if entity.dxftype == "LINE":
-            row = _as_line_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            line_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "POINT":
-            row = _as_point_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            point_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "RAY":
-            row = _as_ray_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            ray_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "XLINE":
-            row = _as_xline_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            xline_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "ARC":
-            row = _as_arc_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            arc_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "CIRCLE":
-            row = _as_circle_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            circle_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "LWPOLYLINE":
-            row = _as_lwpolyline_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            lwpolyline_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "TEXT":
-            row = _as_text_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            text_rows.append(row)
-            written += 1
-            continue
-        if entity.dxftype == "MTEXT":
-            row = _as_mtext_row(entity)
-            if row is None:
-                skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
-                continue
-            mtext_rows.append(row)
-            written += 1
+        dxftype = entity.dxftype
+        bucket = entities_by_type.get(dxftype)
+        if bucket is None:
+            entities_by_type[dxftype] = [entity]
+        else:
+            bucket.append(entity)
+
+    for dxftype, entities in entities_by_type.items():
+        total += len(entities)
+        writer = row_writers.get(dxftype)
+        if writer is None:
+            skipped_by_type[dxftype] = len(entities)
             continue
-        skipped_by_type[entity.dxftype] = skipped_by_type.get(entity.dxftype, 0) + 1
+        build_row, rows = writer
+        rows.extend(row for row in map(build_row, entities) if row is not None)
+        failed = len(entities) - len(rows)
+        if failed:
+            skipped_by_type[dxftype] = failed
+        written += len(rows)
 
     skipped = total - written
     if strict and skipped > 0:
@@ -450,8 +440,9 @@ def to_dxf(
         )
         # Block definitions are assembled just above; drop memoized block
         # safety/span caches so modelspace INSERT handling sees final content.
-        _BLOCK_INSERT_SAFETY_CACHE.pop(dxf_doc, None)
-        _BLOCK_LOCAL_Y_SPAN_CACHE.pop(dxf_doc, None)
+        _discard_per_doc_cache(_BLOCK_INSERT_SAFETY_CACHE, dxf_doc)
+        _discard_per_doc_cache(_BLOCK_LOCAL_Y_SPAN_CACHE, dxf_doc)
+        _prime_block_insert_safety_cache(dxf_doc)
 
     total = 0
     written = 0
@@ -2356,8 +2347,13 @@ def _resolve_export_entities(
     elif include_unsupported:
         query_types = None
     else:
-        present_types = set(_present_supported_types(layout.doc.decode_path))
-        query_types = tuple(sorted(present_types & _WRITABLE_ENTITY_TYPES))
+        query_types = tuple(
+            sorted(_WRITABLE_ENTITY_TYPES.intersection(_present_supported_types(layout.doc.decode_path)))
+        )
+        if not query_types:
+            # An empty type list would make query() fall back to every
+            # present type, none of which can be written.
+            return []
     selected_entities = list(layout.query(query_types, include_styles=include_styles))
     if modelspace_only:
         selected_entities = _filter_modelspace_entities(
@@ -2376,8 +2372,12 @@ def _resolve_dwg_export_entities(
     if types is not None:
         query_types = types
     else:
-        present_types = set(_present_supported_types(layout.doc.decode_path))
-        query_types = tuple(sorted(present_types & _DWG_WRITABLE_ENTITY_TYPES))
+        query_types = tuple(
+            sorted(_DWG_WRITABLE_ENTITY_TYPES.intersection(_present_supported_types(layout.doc.decode_path)))
+        )
+        if not query_types:
+            # See _resolve_export_entities: skip the all-types fallback.
+            return []
     selected_entities = list(layout.query(query_types))
     return _materialize_export_entities(layout, selected_entities)
 
@@ -2397,14 +2397,15 @@ def _filter_modelspace_entities(
     if modelspace_info is None:
         return entities
     modelspace_handles, modelspace_owner_handles = modelspace_info
-    filtered: list[Entity] = []
-    for entity in entities:
+    filtered = [
+        entity
+        for entity in entities
         if _entity_is_modelspace_owned(
             entity,
             modelspace_handles=modelspace_handles,
             modelspace_owner_handles=modelspace_owner_handles,
-        ):
-            filtered.append(entity)
+        )
+    ]
     if not filtered and entities:
         # Some drawings store modelspace ownership in ways this heuristic
         # cannot recover reliably yet. Keep behavior non-destructive.
@@ -2695,10 +2696,23 @@ def _resolve_modelspace_entity_handles(
     *,
     decode_cache: _ConvertDecodeCache | None = None,
 ) -> tuple[set[int], set[int]] | None:
-    try:
-        header_rows = raw.list_object_headers_with_type(decode_path)
-    except Exception:
-        return None
+    if decode_cache is None:
+        return _resolve_modelspace_entity_handles_uncached(decode_path)
+    if not decode_cache.modelspace_entity_handles_resolved:
+        decode_cache.modelspace_entity_handles = _resolve_modelspace_entity_handles_uncached(
+            decode_path,
+            decode_cache=decode_cache,
+        )
+        decode_cache.modelspace_entity_handles_resolved = True
+    return decode_cache.modelspace_entity_handles
+
+
+def _resolve_modelspace_entity_handles_uncached(
+    decode_path: str,
+    *,
+    decode_cache: _ConvertDecodeCache | None = None,
+) -> tuple[set[int], set[int]] | None:
+    header_rows = _decode_object_header_rows(decode_path, decode_cache=decode_cache)
     if not header_rows:
         return None
 
@@ -2718,23 +2732,9 @@ def _resolve_modelspace_entity_handles(
     if not modelspace_block_handles:
         return None
 
-    sorted_rows = sorted(
-        header_rows,
-        key=lambda row: int(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0,
-    )
     block_stack: list[int] = []
     handles: set[int] = set()
-    for row in sorted_rows:
-        if not isinstance(row, tuple) or len(row) < 6:
-            continue
-        raw_handle, _offset, _size, _code, raw_type_name, raw_type_class = row
-        if str(raw_type_class).strip().upper() not in {"E", "ENTITY"}:
-            continue
-        try:
-            handle = int(raw_handle)
-        except Exception:
-            continue
-        type_name = str(raw_type_name).strip().upper()
+    for handle, _offset, type_name in _entity_header_rows(header_rows, decode_cache=decode_cache):
         if type_name == "BLOCK":
             block_stack.append(handle)
             continue
@@ -2747,6 +2747,96 @@ def _resolve_modelspace_entity_handles(
     return handles, modelspace_block_handles
 
 
+def _decode_object_header_rows(
+    decode_path: str,
+    *,
+    decode_cache: _ConvertDecodeCache | None = None,
+) -> list[tuple[Any, ...]] | None:
+    if decode_cache is not None and decode_cache.object_header_rows is not None:
+        return decode_cache.object_header_rows
+    try:
+        rows = list(raw.list_object_headers_with_type(decode_path))
+    except Exception:
+        return None
+    if decode_cache is not None:
+        decode_cache.object_header_rows = rows
+    return rows
+
+
+def _sorted_object_header_rows(
+    header_rows: list[tuple[Any, ...]],
+    *,
+    decode_cache: _ConvertDecodeCache | None = None,
+) -> list[tuple[Any, ...]]:
+    # Header rows in stream-offset order, sorted once per conversion.
+    if decode_cache is not None and header_rows is not decode_cache.object_header_rows:
+        decode_cache = None
+    if decode_cache is not None and decode_cache.sorted_object_header_rows is not None:
+        return decode_cache.sorted_object_header_rows
+    sorted_rows = sorted(
+        header_rows,
+        key=lambda row: int(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0,
+    )
+    if decode_cache is not None:
+        decode_cache.sorted_object_header_rows = sorted_rows
+    return sorted_rows
+
+
+def _entity_header_rows(
+    header_rows: list[tuple[Any, ...]],
+    *,
+    decode_cache: _ConvertDecodeCache | None = None,
+) -> list[tuple[int, int | None, str]]:
+    # Entity-class header rows as (handle, offset, TYPE_NAME) in stream order.
+    # The cached form is only reused for the rows it was built from, so the
+    # str/strip/upper normalization runs once per conversion.
+    if decode_cache is not None and decode_cache.object_header_rows is not None and (
+        header_rows is decode_cache.object_header_rows
+        or header_rows is decode_cache.sorted_object_header_rows
+    ):
+        if decode_cache.entity_header_rows is None:
+            decode_cache.entity_header_rows = _normalize_entity_header_rows(
+                _sorted_object_header_rows(
+                    decode_cache.object_header_rows,
+                    decode_cache=decode_cache,
+                )
+            )
+        return decode_cache.entity_header_rows
+    return _normalize_entity_header_rows(_sorted_object_header_rows(header_rows))
+
+
+def _is_entity_type_class(raw_type_class: Any) -> bool:
+    # The decoder emits the canonical "E"/"O" class tokens, so the generic
+    # normalization only runs for unexpected spellings.
+    if raw_type_class == "E":
+        return True
+    if raw_type_class == "O":
+        return False
+    return str(raw_type_class).strip().upper() in {"E", "ENTITY"}
+
+
+def _normalize_entity_header_rows(
+    header_rows: list[tuple[Any, ...]],
+) -> list[tuple[int, int | None, str]]:
+    entity_rows: list[tuple[int, int | None, str]] = []
+    for row in header_rows:
+        if not isinstance(row, tuple) or len(row) < 6:
+            continue
+        raw_handle, raw_offset, _size, _code, raw_type_name, raw_type_class = row
+        if not _is_entity_type_class(raw_type_class):
+            continue
+        try:
+            handle = int(raw_handle)
+        except Exception:
+            continue
+        try:
+            offset: int | None = int(raw_offset)
+        except Exception:
+            offset = None
+        entity_rows.append((handle, offset, str(raw_type_name).strip().upper()))
+    return entity_rows
+
+
 def _is_modelspace_block_name(name: str | None) -> bool:
     if not isinstance(name, str):
         return False
@@ -2768,12 +2858,15 @@ def _materialize_export_entities(
     seen_entity_keys: set[tuple[str, int]] = set()
     first_dxf_by_key: dict[tuple[str, int], Any] = {}
     seen_frozen_dxf_by_key: dict[tuple[str, int], set[str]] = {}
-    owner_requests: list[tuple[int, str | None]] = []
+    # Every vertex of a sequence points at the same owner; collect each owner
+    # handle once, in first-seen order.
+    owner_handles: dict[int, None] = {}
+    owner_types: set[str] = set()
 
     for entity in selected_entities:
-        handle = int(entity.handle)
-        if entity.dxftype in _BLOCK_EXCLUDED_ENTITY_TYPES:
-            if entity.dxftype in _VERTEX_SEQUENCE_ENTITY_TYPES:
+        dxftype = entity.dxftype
+        if dxftype in _BLOCK_EXCLUDED_ENTITY_TYPES:
+            if dxftype in _VERTEX_SEQUENCE_ENTITY_TYPES:
                 owner_handle = entity.dxf.get("owner_handle")
                 if owner_handle is None:
                     continue
@@ -2786,13 +2879,10 @@ def _materialize_export_entities(
                     and owner_handle_int not in allowed_owner_handles
                 ):
                     continue
+                owner_handles[owner_handle_int] = None
                 owner_type = entity.dxf.get("owner_type")
-                owner_requests.append(
-                    (
-                        owner_handle_int,
-                        str(owner_type).strip().upper() if isinstance(owner_type, str) else None,
-                    )
-                )
+                if isinstance(owner_type, str):
+                    owner_types.add(owner_type.strip().upper())
             continue
         if not _append_unique_export_entity(
             export_entities,
@@ -2803,12 +2893,10 @@ def _materialize_export_entities(
         ):
             continue
 
-    if not owner_requests:
+    if not owner_handles:
         return export_entities
 
-    requested_owner_types = {
-        owner_type for _, owner_type in owner_requests if owner_type in _POLYLINE_OWNER_TYPES
-    }
+    requested_owner_types = owner_types & _POLYLINE_OWNER_TYPES
     if not requested_owner_types:
         requested_owner_types = set(_POLYLINE_OWNER_TYPES)
     if owners_by_handle is None:
@@ -2819,15 +2907,14 @@ def _materialize_export_entities(
             for handle, entity in owners_by_handle.items()
             if entity.dxftype in requested_owner_types
         }
-    for owner_handle, _owner_type in owner_requests:
+    # Owners are resolved by the handles already checked against
+    # allowed_owner_handles above.
+    for owner_handle in owner_handles:
         owner_entity = resolved_owners_by_handle.get(owner_handle)
         if owner_entity is None:
             continue
         if owner_entity.dxftype in _BLOCK_EXCLUDED_ENTITY_TYPES:
             continue
-        handle = int(owner_entity.handle)
-        if allowed_owner_handles is not None and handle not in allowed_owner_handles:
-            continue
         _append_unique_export_entity(
             export_entities,
             owner_entity,
@@ -2922,8 +3009,11 @@ def _insert_attributes_by_owner(
             continue
         attrs_by_owner.setdefault(owner_handle_int, []).append(entity)
 
-    for owner_handle, entities in attrs_by_owner.items():
-        attrs_by_owner[owner_handle] = sorted(entities, key=lambda entry: int(entry.handle))
+    # sort() evaluates the key once per entry; most INSERTs own a single
+    # ATTRIB, so only multi-attribute lists are sorted, in place.
+    for entities in attrs_by_owner.values():
+        if len(entities) > 1:
+            entities.sort(key=lambda entry: int(entry.handle))
     return attrs_by_owner
 
 
@@ -2934,23 +3024,28 @@ def _attach_insert_attributes(
     if not selected_entities or not insert_attributes_by_owner:
         return selected_entities
 
-    export_entities: list[Entity] = []
-    for entity in selected_entities:
+    # Copy-on-write: most entities pass through untouched, so the input list
+    # is only copied once an INSERT actually needs its attributes attached.
+    export_entities: list[Entity] | None = None
+    for index, entity in enumerate(selected_entities):
         if entity.dxftype not in {"INSERT", "MINSERT"}:
-            export_entities.append(entity)
             continue
         try:
             handle = int(entity.handle)
         except Exception:
-            export_entities.append(entity)
             continue
         attributes = insert_attributes_by_owner.get(handle)
         if not attributes:
-            export_entities.append(entity)
             continue
-        dxf = dict(entity.dxf)
-        dxf["attributes"] = [dict(attribute.dxf) for attribute in attributes]
-        export_entities.append(Entity(dxftype=entity.dxftype, handle=entity.handle, dxf=dxf))
+        if export_entities is None:
+            export_entities = list(selected_entities)
+        # The INSERT's own dxf belongs to the document's entity cache, so the
+        # export copy gets a fresh top-level dict. Attribute dicts are only
+        # read by the writers and are shared rather than copied.
+        dxf = {**entity.dxf, "attributes": [attribute.dxf for attribute in attributes]}
+        export_entities[index] = Entity(dxftype=entity.dxftype, handle=entity.handle, dxf=dxf)
+    if export_entities is None:
+        return selected_entities
     return export_entities
 
 
@@ -3025,10 +3120,7 @@ def _populate_block_definitions(
         return
 
     decode_path = layout.doc.decode_path or layout.doc.path
-    try:
-        header_rows = raw.list_object_headers_with_type(decode_path)
-    except Exception:
-        return
+    header_rows = _decode_object_header_rows(decode_path, decode_cache=decode_cache)
     if not header_rows:
         return
 
@@ -3041,10 +3133,7 @@ def _populate_block_definitions(
     if not block_name_by_handle:
         return
 
-    sorted_header_rows = sorted(
-        header_rows,
-        key=lambda row: int(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0,
-    )
+    sorted_header_rows = _sorted_object_header_rows(header_rows, decode_cache=decode_cache)
     endblk_name_by_handle = _resolve_block_end_name_by_handle_exact(
         decode_path,
         header_rows=header_rows,
@@ -3055,6 +3144,7 @@ def _populate_block_definitions(
         sorted_header_rows,
         block_name_by_handle,
         endblk_name_by_handle=endblk_name_by_handle,
+        decode_cache=decode_cache,
     )
 
     if not block_members_by_name:
@@ -3065,14 +3155,20 @@ def _populate_block_definitions(
         name for name in referenced_names if name in block_members_by_name
     }
     has_member_candidates = any(block_members_by_name.get(name) for name in selected_block_names)
+    # Group the caller's handle index by type once; the INSERT, member and
+    # owner lookups below each only need a few of the types.
+    cached_entities_by_type: dict[str, dict[int, Entity]] = {}
+    if cached_entities_by_handle is not None:
+        for handle, entity in cached_entities_by_handle.items():
+            typed = cached_entities_by_type.get(entity.dxftype)
+            if typed is None:
+                cached_entities_by_type[entity.dxftype] = {handle: entity}
+            else:
+                typed[handle] = entity
     insert_entities_by_handle: dict[int, Entity] = {}
     if has_member_candidates:
-        if cached_entities_by_handle is not None:
-            insert_entities_by_handle = {
-                handle: entity
-                for handle, entity in cached_entities_by_handle.items()
-                if entity.dxftype in {"INSERT", "MINSERT"}
-            }
+        for insert_type in ("INSERT", "MINSERT"):
+            insert_entities_by_handle.update(cached_entities_by_type.get(insert_type, {}))
         if include_styles:
             insert_entities_by_handle.update(_entities_by_handle(layout, {"INSERT", "MINSERT"}))
         else:
@@ -3113,19 +3209,14 @@ def _populate_block_definitions(
             )
         except TypeError:
             exact_block_name_by_handle = _resolve_block_name_by_handle_exact(decode_path)
-        block_handles_set: set[int] = set()
-        for row in header_rows:
-            if not isinstance(row, tuple) or len(row) < 6:
-                continue
-            raw_handle, _offset, _size, _code, raw_type_name, raw_type_class = row
-            if str(raw_type_class).strip().upper() not in {"E", "ENTITY"}:
-                continue
-            if str(raw_type_name).strip().upper() != "BLOCK":
-                continue
-            try:
-                block_handles_set.add(int(raw_handle))
-            except Exception:
-                continue
+        block_handles_set = {
+            handle
+            for handle, _offset, type_name in _entity_header_rows(
+                header_rows,
+                decode_cache=decode_cache,
+            )
+            if type_name == "BLOCK"
+        }
         exact_block_name_by_handle = {
             handle: name
             for handle, name in exact_block_name_by_handle.items()
@@ -3149,6 +3240,7 @@ def _populate_block_definitions(
                 sorted_header_rows,
                 block_name_by_handle,
                 endblk_name_by_handle=endblk_name_by_handle,
+                decode_cache=decode_cache,
             )
             selected_block_names = {
                 name for name in referenced_names if name in block_members_by_name
@@ -3179,17 +3271,16 @@ def _populate_block_definitions(
             canonical = _canonical_entity_type(raw_type_name)
             if canonical not in all_member_types:
                 continue
-            try:
-                required_member_keys.add((int(member_handle), canonical))
-            except Exception:
-                continue
+            required_member_keys.add((member_handle, canonical))
 
     missing_member_types = set(all_member_types)
     cached_member_keys: set[tuple[int, str]] = set()
     if cached_entities_by_handle is not None:
-        for handle, entity in cached_entities_by_handle.items():
-            token = str(entity.dxftype).strip().upper()
-            if token in all_member_types:
+        for dxftype, typed_entities in cached_entities_by_type.items():
+            token = str(dxftype).strip().upper()
+            if token not in all_member_types:
+                continue
+            for handle, entity in typed_entities.items():
                 try:
                     handle_int = int(handle)
                 except Exception:
@@ -3203,16 +3294,11 @@ def _populate_block_definitions(
                 token for _handle, token in (required_member_keys - cached_member_keys)
             }
     if missing_member_types:
-        if include_styles:
-            queried_entities_by_handle_type = _entities_by_handle_and_type_multi(
-                layout,
-                missing_member_types,
-            )
-        else:
-            queried_entities_by_handle_type = _entities_by_handle_and_type_multi_no_styles(
-                layout,
-                missing_member_types,
-            )
+        queried_entities_by_handle_type = _entities_by_handle_and_type_multi_impl(
+            layout,
+            missing_member_types,
+            include_styles=include_styles,
+        )
         for key, entity_list in queried_entities_by_handle_type.items():
             if not entity_list:
                 continue
@@ -3225,21 +3311,32 @@ def _populate_block_definitions(
         for handle, entity in entities_by_handle.items()
         if entity.dxftype in _POLYLINE_OWNER_TYPES
     }
+    # Resolve every selected block's member entities once; the owner-type
+    # scan below and the per-block export loop both consume the result.
+    member_entities_by_block = {
+        block_name: _resolve_block_member_entities(
+            block_members_by_name.get(block_name, []),
+            entities_by_handle_type,
+            entities_by_handle,
+        )
+        for block_name in selected_block_names
+    }
     owner_type_hints: set[str] = set()
-    for block_name in selected_block_names:
-        for handle, raw_type_name in block_members_by_name.get(block_name, []):
-            handle_int = int(handle)
-            canonical = _canonical_entity_type(raw_type_name)
-            entity_list = (
-                entities_by_handle_type.get((handle_int, canonical))
-                if canonical is not None
-                else None
-            )
-            entity = entity_list[0] if entity_list else None
-            if entity is None:
-                entity = entities_by_handle.get(handle_int)
-            if entity is None or entity.dxftype not in _VERTEX_SEQUENCE_ENTITY_TYPES:
+    # Only blocks holding vertex entities consult their member handle set
+    # (to keep owners inside the block), so the set is built just for them.
+    vertex_block_names: set[str] = set()
+    # Likewise only blocks with an attribute-owning INSERT need the
+    # attribute attachment pass.
+    attributed_block_names: set[str] = set()
+    for block_name, member_entities in member_entities_by_block.items():
+        for entity in member_entities:
+            if entity.dxftype in {"INSERT", "MINSERT"}:
+                if insert_attributes_by_owner and entity.handle in insert_attributes_by_owner:
+                    attributed_block_names.add(block_name)
                 continue
+            if entity.dxftype not in _VERTEX_SEQUENCE_ENTITY_TYPES:
+                continue
+            vertex_block_names.add(block_name)
             owner_type = entity.dxf.get("owner_type")
             if not isinstance(owner_type, str):
                 continue
@@ -3248,11 +3345,11 @@ def _populate_block_definitions(
                 owner_type_hints.add(owner_type_token)
     if owner_type_hints:
         missing_owner_types = set(owner_type_hints)
-        if cached_entities_by_handle is not None:
-            for handle, entity in cached_entities_by_handle.items():
-                if entity.dxftype in owner_type_hints:
-                    owner_entities_by_handle[handle] = entity
-                    missing_owner_types.discard(entity.dxftype)
+        for owner_type in owner_type_hints:
+            typed_owners = cached_entities_by_type.get(owner_type)
+            if typed_owners:
+                owner_entities_by_handle.update(typed_owners)
+                missing_owner_types.discard(owner_type)
         if missing_owner_types:
             if include_styles:
                 owner_entities_by_handle.update(
@@ -3263,9 +3360,12 @@ def _populate_block_definitions(
                     _entities_by_handle_no_styles(layout, missing_owner_types)
                 )
 
-    block_layouts: dict[str, Any] = {}
-    for block_name in sorted(selected_block_names):
-        block_layouts[block_name] = _ensure_block_layout(dxf_doc, block_name)
+    ordered_block_names = sorted(selected_block_names)
+    blocks = dxf_doc.blocks
+    block_layouts: dict[str, Any] = {
+        block_name: _ensure_block_layout(blocks, block_name)
+        for block_name in ordered_block_names
+    }
 
     reference_graph = _build_block_reference_graph(
         block_members_by_name,
@@ -3274,41 +3374,23 @@ def _populate_block_definitions(
     )
     recursive_targets_by_block = _collect_recursive_targets(reference_graph)
 
-    for block_name in sorted(selected_block_names):
+    for block_name in ordered_block_names:
         block_layout = block_layouts[block_name]
-        members = block_members_by_name.get(block_name, [])
-        member_handles = {int(handle) for handle, _raw_type_name in members}
-        selected_entities: list[Entity] = []
-        consumed_entities_by_key: dict[tuple[int, str], int] = {}
-        for handle, raw_type_name in members:
-            handle_int = int(handle)
-            canonical = _canonical_entity_type(raw_type_name)
-            entity = None
-            if canonical is not None:
-                key = (handle_int, canonical)
-                entity_list = entities_by_handle_type.get(key) or []
-                consume_index = consumed_entities_by_key.get(key, 0)
-                if consume_index < len(entity_list):
-                    entity = entity_list[consume_index]
-                    consumed_entities_by_key[key] = consume_index + 1
-                elif entity_list:
-                    entity = entity_list[-1]
-            if entity is None:
-                candidate = entities_by_handle.get(handle_int)
-                if canonical is None or (
-                    candidate is not None and str(candidate.dxftype).strip().upper() == canonical
-                ):
-                    entity = candidate
-            if entity is None:
-                continue
-            selected_entities.append(entity)
+        member_handles = (
+            {handle for handle, _raw_type_name in block_members_by_name.get(block_name, [])}
+            if block_name in vertex_block_names
+            else None
+        )
         export_entities = _materialize_export_entities(
             layout,
-            selected_entities,
+            member_entities_by_block[block_name],
             allowed_owner_handles=member_handles,
             owners_by_handle=owner_entities_by_handle,
         )
-        export_entities = _attach_insert_attributes(export_entities, insert_attributes_by_owner)
+        if block_name in attributed_block_names:
+            export_entities = _attach_insert_attributes(
+                export_entities, insert_attributes_by_owner
+            )
         prefer_open30 = _block_prefers_open30_arrowhead(export_entities)
         open30_consumed = False
         for entity in export_entities:
@@ -3339,11 +3421,45 @@ def _populate_block_definitions(
             )
 
 
+def _resolve_block_member_entities(
+    members: list[tuple[int, str]],
+    entities_by_handle_type: dict[tuple[int, str], list[Entity]],
+    entities_by_handle: dict[int, Entity],
+) -> list[Entity]:
+    # Repeated (handle, type) members consume successive decoded entities so
+    # duplicate handles inside one block map to distinct rows.
+    selected_entities: list[Entity] = []
+    consumed_entities_by_key: dict[tuple[int, str], int] = {}
+    for handle, raw_type_name in members:
+        canonical = _canonical_entity_type(raw_type_name)
+        entity = None
+        if canonical is not None:
+            key = (handle, canonical)
+            entity_list = entities_by_handle_type.get(key) or []
+            consume_index = consumed_entities_by_key.get(key, 0)
+            if consume_index < len(entity_list):
+                entity = entity_list[consume_index]
+                consumed_entities_by_key[key] = consume_index + 1
+            elif entity_list:
+                entity = entity_list[-1]
+        if entity is None:
+            candidate = entities_by_handle.get(handle)
+            if canonical is None or (
+                candidate is not None and str(candidate.dxftype).strip().upper() == canonical
+            ):
+                entity = candidate
+        if entity is None:
+            continue
+        selected_entities.append(entity)
+    return selected_entities
+
+
 def _collect_block_members_by_name(
     sorted_header_rows: list[tuple[Any, ...]],
     block_name_by_handle: dict[int, str],
     *,
     endblk_name_by_handle: dict[int, str] | None = None,
+    decode_cache: _ConvertDecodeCache | None = None,
 ) -> dict[str, list[tuple[int, str]]]:
     # Collect each BLOCK definition independently first, then choose one
     # representative definition per name. Prefer closing by ENDBLK name when
@@ -3376,22 +3492,11 @@ def _collect_block_members_by_name(
             context = stack.pop()
             _commit_candidate(context["name"], context["members"])
 
-    for row in sorted_header_rows:
-        if not isinstance(row, tuple) or len(row) < 6:
-            continue
-        raw_handle, raw_offset, _size, _code, raw_type_name, raw_type_class = row
-        if str(raw_type_class).strip().upper() not in {"E", "ENTITY"}:
-            continue
-        try:
-            handle = int(raw_handle)
-        except Exception:
-            continue
-        try:
-            offset = int(raw_offset)
-        except Exception:
-            offset = None
-        type_name = str(raw_type_name).strip().upper()
-
+    if decode_cache is not None and sorted_header_rows is decode_cache.sorted_object_header_rows:
+        entity_rows = _entity_header_rows(sorted_header_rows, decode_cache=decode_cache)
+    else:
+        entity_rows = _normalize_entity_header_rows(sorted_header_rows)
+    for handle, offset, type_name in entity_rows:
         if type_name == "BLOCK":
             block_name = block_name_by_handle.get(handle)
             normalized_block_name = (
@@ -3466,7 +3571,7 @@ def _build_block_reference_graph(
         for handle, raw_type_name in block_members_by_name.get(source_name, []):
             if _canonical_entity_type(raw_type_name) not in {"INSERT", "MINSERT"}:
                 continue
-            insert_entity = insert_entities_by_handle.get(int(handle))
+            insert_entity = insert_entities_by_handle.get(handle)
             if insert_entity is None:
                 continue
             target_name = _normalize_block_name(insert_entity.dxf.get("name"))
@@ -3804,27 +3909,28 @@ def _looks_like_problematic_i_open30_insert(dxf: dict[str, Any]) -> bool:
     return True
 
 
-def _resolve_block_name_by_handle(
-    decode_path: str,
+def _block_handles_in_order(
     header_rows: list[tuple[Any, ...]],
     *,
-    referenced_names: set[str] | None = None,
     decode_cache: _ConvertDecodeCache | None = None,
-) -> dict[int, str]:
-    cache_key: tuple[str, ...] | None = (
-        None if referenced_names is None else tuple(sorted(referenced_names))
-    )
-    if decode_cache is not None:
-        cached = decode_cache.block_name_by_handle_cache.get(cache_key)
-        if cached is not None:
-            return dict(cached)
-
+) -> list[int]:
+    # BLOCK entity handles in header stream order. Block name resolution runs
+    # several times per conversion (modelspace ownership, block definitions,
+    # ENDBLK names), so the scan is cached for the decoded header rows.
+    if decode_cache is not None and header_rows is decode_cache.object_header_rows:
+        if decode_cache.block_handles_in_order is None:
+            decode_cache.block_handles_in_order = _scan_block_handles_in_order(header_rows)
+        return decode_cache.block_handles_in_order
+    return _scan_block_handles_in_order(header_rows)
+
+
+def _scan_block_handles_in_order(header_rows: list[tuple[Any, ...]]) -> list[int]:
     block_handles_in_order: list[int] = []
     for row in header_rows:
         if not isinstance(row, tuple) or len(row) < 6:
             continue
         raw_handle, _offset, _size, _code, raw_type_name, raw_type_class = row
-        if str(raw_type_class).strip().upper() not in {"E", "ENTITY"}:
+        if not _is_entity_type_class(raw_type_class):
             continue
         if str(raw_type_name).strip().upper() != "BLOCK":
             continue
@@ -3832,6 +3938,25 @@ def _resolve_block_name_by_handle(
             block_handles_in_order.append(int(raw_handle))
         except Exception:
             continue
+    return block_handles_in_order
+
+
+def _resolve_block_name_by_handle(
+    decode_path: str,
+    header_rows: list[tuple[Any, ...]],
+    *,
+    referenced_names: set[str] | None = None,
+    decode_cache: _ConvertDecodeCache | None = None,
+) -> dict[int, str]:
+    cache_key: tuple[str, ...] | None = (
+        None if referenced_names is None else tuple(sorted(referenced_names))
+    )
+    if decode_cache is not None:
+        cached = decode_cache.block_name_by_handle_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+    block_handles_in_order = _block_handles_in_order(header_rows, decode_cache=decode_cache)
     if not block_handles_in_order:
         return {}
 
@@ -4042,30 +4167,13 @@ def _resolve_block_end_name_by_handle_exact(
     # Some snapshots expose incomplete ENDBLK names via decode_block_entity_names.
     # Fill missing names by declaration order to stabilize BLOCK membership windows.
     if header_rows is None:
-        try:
-            header_rows = raw.list_object_headers_with_type(decode_path)
-        except Exception:
-            header_rows = []
+        header_rows = _decode_object_header_rows(decode_path, decode_cache=decode_cache)
     if not header_rows:
         return result
 
-    sorted_header_rows = sorted(
-        header_rows,
-        key=lambda row: int(row[1]) if isinstance(row, tuple) and len(row) > 1 else 0,
-    )
     block_handles_in_order: list[int] = []
     endblk_handles_in_order: list[int] = []
-    for row in sorted_header_rows:
-        if not isinstance(row, tuple) or len(row) < 6:
-            continue
-        raw_handle, _offset, _size, _code, raw_type_name, raw_type_class = row
-        if str(raw_type_class).strip().upper() not in {"E", "ENTITY"}:
-            continue
-        type_name = str(raw_type_name).strip().upper()
-        try:
-            handle = int(raw_handle)
-        except Exception:
-            continue
+    for handle, _offset, type_name in _entity_header_rows(header_rows, decode_cache=decode_cache):
         if type_name == "BLOCK":
             block_handles_in_order.append(handle)
         elif type_name == "ENDBLK":
@@ -4103,20 +4211,6 @@ def _entities_by_handle_no_styles(layout: Layout, types: set[str]) -> dict[int,
     return _entities_by_handle_impl(layout, types, include_styles=False)
 
 
-def _entities_by_handle_and_type_multi(
-    layout: Layout,
-    types: set[str],
-) -> dict[tuple[int, str], list[Entity]]:
-    return _entities_by_handle_and_type_multi_impl(layout, types, include_styles=True)
-
-
-def _entities_by_handle_and_type_multi_no_styles(
-    layout: Layout,
-    types: set[str],
-) -> dict[tuple[int, str], list[Entity]]:
-    return _entities_by_handle_and_type_multi_impl(layout, types, include_styles=False)
-
-
 def _entities_by_handle_impl(
     layout: Layout,
     types: set[str],
@@ -4124,29 +4218,35 @@ def _entities_by_handle_impl(
     include_styles: bool,
 ) -> dict[int, Entity]:
     result: dict[int, Entity] = {}
+    if not types:
+        return result
+    ordered_types = sorted(types)
 
-    # INSERT/MINSERT has a shared fast-path in Layout.query().
-    if types == {"INSERT", "MINSERT"}:
+    # A single multi-type query lets Layout.query() share decoded rows and
+    # style maps across types (INSERT/MINSERT, LINE/ARC/CIRCLE bulk rows).
+    # Decoded handles are already ints; only foreign values go through int().
+    query_types = " ".join(ordered_types)
+    try:
         try:
-            entities = layout.query("INSERT MINSERT", include_styles=include_styles)
+            entities = layout.query(query_types, include_styles=include_styles)
         except TypeError:
-            try:
-                entities = layout.query("INSERT MINSERT")
-            except Exception:
-                entities = []
-        except Exception:
-            entities = []
-        try:
-            for entity in entities:
+            entities = layout.query(query_types)
+        for entity in entities:
+            handle = entity.handle
+            if type(handle) is not int:
                 try:
-                    result[int(entity.handle)] = entity
+                    handle = int(handle)
                 except Exception:
                     continue
-        except Exception:
-            return result
+            result[handle] = entity
         return result
+    except Exception:
+        if len(ordered_types) == 1:
+            return result
 
-    for dxftype in sorted(types):
+    # Fall back to per-type queries so one failing type does not drop the
+    # entities of the others.
+    for dxftype in ordered_types:
         try:
             entities = layout.query(dxftype, include_styles=include_styles)
         except TypeError:
@@ -4159,10 +4259,13 @@ def _entities_by_handle_impl(
             continue
         try:
             for entity in entities:
-                try:
-                    result[int(entity.handle)] = entity
-                except Exception:
-                    continue
+                handle = entity.handle
+                if type(handle) is not int:
+                    try:
+                        handle = int(handle)
+                    except Exception:
+                        continue
+                result[handle] = entity
         except Exception:
             continue
     return result
@@ -4205,36 +4308,31 @@ def _collect_referenced_block_names(
     referenced_names: set[str],
     insert_entities_by_handle: dict[int, Entity],
 ) -> set[str]:
-    selected_block_names: set[str] = set()
-    pending_names: list[str] = [
+    # Names are marked selected when pushed, so each block is queued at most
+    # once and the selection set doubles as the visited set.
+    selected_block_names: set[str] = {
         name
         for name in referenced_names
         if name in block_members_by_name
-    ]
-    pending_name_set: set[str] = set(pending_names)
+    }
+    pending_names: list[str] = list(selected_block_names)
     while pending_names:
         name = pending_names.pop()
-        pending_name_set.discard(name)
-        if name in selected_block_names:
-            continue
-        selected_block_names.add(name)
         for handle, raw_type_name in block_members_by_name.get(name, []):
             if _canonical_entity_type(raw_type_name) not in {"INSERT", "MINSERT"}:
                 continue
-            insert_entity = insert_entities_by_handle.get(int(handle))
+            insert_entity = insert_entities_by_handle.get(handle)
             if insert_entity is None:
                 continue
             nested_name = _normalize_block_name(insert_entity.dxf.get("name"))
-            if nested_name is None:
+            if nested_name is None or nested_name in selected_block_names:
                 continue
             if _is_layout_pseudo_block_name(nested_name):
                 continue
             if nested_name not in block_members_by_name:
                 continue
-            if nested_name in selected_block_names or nested_name in pending_name_set:
-                continue
+            selected_block_names.add(nested_name)
             pending_names.append(nested_name)
-            pending_name_set.add(nested_name)
     return selected_block_names
 
 
@@ -4247,10 +4345,7 @@ def _has_unresolved_selected_block_targets(
         for handle, raw_type_name in block_members_by_name.get(source_name, []):
             if _canonical_entity_type(raw_type_name) not in {"INSERT", "MINSERT"}:
                 continue
-            try:
-                insert_entity = insert_entities_by_handle.get(int(handle))
-            except Exception:
-                continue
+            insert_entity = insert_entities_by_handle.get(handle)
             if insert_entity is None:
                 continue
             target_name = _normalize_block_name(insert_entity.dxf.get("name"))
@@ -4280,7 +4375,7 @@ def _dimension_anonymous_block_name(dxf: dict[str, Any]) -> str | None:
     name = _normalize_block_name(dxf.get("anonymous_block_name"))
     if name is None:
         return None
-    if not name.upper().startswith("*D"):
+    if not _is_anonymous_dimension_block_name(name):
         return None
     return name
 
@@ -4299,6 +4394,12 @@ def _is_layout_pseudo_block_name(name: str) -> bool:
     return upper.startswith("*MODEL_SPACE") or upper.startswith("*PAPER_SPACE")
 
 
+def _is_anonymous_dimension_block_name(name: str) -> bool:
+    # Equivalent to name.upper().startswith("*D") without allocating an
+    # uppercased copy of the name on every check.
+    return name.startswith(("*D", "*d"))
+
+
 def _should_preserve_layout_pseudo_insert(name: str, dxf: dict[str, Any]) -> bool:
     # Keep only modelspace clone-like references. Paper space pseudo inserts
     # often behave as viewport artifacts and should stay skipped.
@@ -4318,13 +4419,42 @@ def _is_layout_pseudo_modelspace_alias_name(name: str) -> bool:
     return name.upper().startswith(_LAYOUT_PSEUDO_MODELSPACE_ALIAS_PREFIX)
 
 
+# Distinguishes "not cached yet" from a cached None in per-document caches.
+_CACHE_MISS: Any = object()
+
+
+def _per_doc_cache(
+    cache: weakref.WeakKeyDictionary[Any, dict[str, Any]],
+    doc: Any,
+) -> dict[str, Any]:
+    # get() before insert rather than setdefault(): setdefault() builds a
+    # fresh callback weakref and an empty dict on every call, hits included.
+    try:
+        by_key = cache.get(doc)
+        if by_key is None:
+            by_key = {}
+            cache[doc] = by_key
+        return by_key
+    except TypeError:
+        # Documents that cannot be weakly referenced are not cached at all;
+        # an id()-keyed fallback could outlive the document and be reused.
+        return {}
+
+
+def _discard_per_doc_cache(
+    cache: weakref.WeakKeyDictionary[Any, dict[str, Any]],
+    doc: Any,
+) -> None:
+    try:
+        cache.pop(doc, None)
+    except TypeError:
+        pass
+
+
 def _ensure_layout_pseudo_block_alias(doc: Any, source_name: str) -> str | None:
     if doc is None:
         return None
-    by_source = _LAYOUT_PSEUDO_ALIAS_CACHE.get(doc)
-    if by_source is None:
-        by_source = {}
-        _LAYOUT_PSEUDO_ALIAS_CACHE[doc] = by_source
+    by_source = _per_doc_cache(_LAYOUT_PSEUDO_ALIAS_CACHE, doc)
     cached = by_source.get(source_name)
     if cached:
         try:
@@ -4359,7 +4489,7 @@ def _ensure_layout_pseudo_block_alias(doc: Any, source_name: str) -> str | None:
                         # These style-helper inserts frequently explode into
                         # oversized diagonal artifacts in Open30-like layouts.
                         continue
-                    if nested_name.upper().startswith("*D"):
+                    if _is_anonymous_dimension_block_name(nested_name):
                         # Nested anonymous dimension graphics inside layout
                         # pseudo blocks frequently expand to scattered
                         # outliers after flattening.
@@ -4376,12 +4506,10 @@ def _cached_block_local_y_span(modelspace: Any, block_name: str) -> float | None
     doc = getattr(modelspace, "doc", None)
     if doc is None:
         return None
-    by_name = _BLOCK_LOCAL_Y_SPAN_CACHE.get(doc)
-    if by_name is None:
-        by_name = {}
-        _BLOCK_LOCAL_Y_SPAN_CACHE[doc] = by_name
-    if block_name in by_name:
-        return by_name[block_name]
+    by_name = _per_doc_cache(_BLOCK_LOCAL_Y_SPAN_CACHE, doc)
+    cached = by_name.get(block_name, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return cached
 
     y_values: list[float] = []
     try:
@@ -4404,16 +4532,17 @@ def _cached_block_local_y_span(modelspace: Any, block_name: str) -> float | None
     return float(span)
 
 
-def _ensure_block_layout(dxf_doc: Any, name: str) -> Any:
+def _ensure_block_layout(blocks: Any, name: str) -> Any:
     try:
-        block_layout = dxf_doc.blocks.get(name)
+        block_layout = blocks.get(name)
         if block_layout is not None:
             return block_layout
     except Exception:
         pass
-    return dxf_doc.blocks.new(name=name)
+    return blocks.new(name=name)
 
 
+@lru_cache(maxsize=512)
 def _canonical_entity_type(raw_type_name: str) -> str:
     token = str(raw_type_name).strip().upper()
     if token.startswith("DIM_"):
@@ -4455,290 +4584,11 @@ def _write_entity_to_modelspace_unsafe(
     dxftype = entity.dxftype
     dxf = entity.dxf
     dxfattribs = _entity_dxfattribs(dxf, layer_name_by_handle=layer_name_by_handle)
-    is_modelspace_layout = bool(getattr(modelspace, "is_modelspace", False))
-
-    if dxftype == "LINE":
-        modelspace.add_line(_point3(dxf.get("start")), _point3(dxf.get("end")), dxfattribs=dxfattribs)
-        return True
+    writer = _ENTITY_WRITERS.get(dxftype)
+    if writer is not None:
+        return writer(modelspace, dxf, dxfattribs)
 
-    if dxftype == "RAY":
-        modelspace.add_ray(
-            _point3(dxf.get("start")),
-            _point3(dxf.get("unit_vector")),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "XLINE":
-        modelspace.add_xline(
-            _point3(dxf.get("start")),
-            _point3(dxf.get("unit_vector")),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "POINT":
-        modelspace.add_point(_point3(dxf.get("location")), dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "ARC":
-        radius = abs(_finite_float(dxf.get("radius", 0.0), 0.0))
-        if radius <= 0.0:
-            return True
-        modelspace.add_arc(
-            _point3(dxf.get("center")),
-            radius,
-            _finite_float(dxf.get("start_angle", 0.0), 0.0),
-            _finite_float(dxf.get("end_angle", 0.0), 0.0),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "CIRCLE":
-        radius = abs(_finite_float(dxf.get("radius", 0.0), 0.0))
-        if radius <= 0.0:
-            return True
-        modelspace.add_circle(
-            _point3(dxf.get("center")),
-            radius,
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "ELLIPSE":
-        modelspace.add_ellipse(
-            _point3(dxf.get("center")),
-            major_axis=_point3(dxf.get("major_axis")),
-            ratio=float(dxf.get("axis_ratio", 1.0)),
-            start_param=float(dxf.get("start_angle", 0.0)),
-            end_param=float(dxf.get("end_angle", 0.0)),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "LWPOLYLINE":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if not points:
-            return False
-        if _distinct_xy_count(points) < 2:
-            # Degenerate width-only polylines can produce invalid extents in
-            # downstream renderers; keep conversion stable by dropping them.
-            return True
-        bulges = list(dxf.get("bulges", []) or [])
-        widths = list(dxf.get("widths", []) or [])
-        vertices = []
-        for i, point in enumerate(points):
-            start_width = 0.0
-            end_width = 0.0
-            if i < len(widths):
-                width = widths[i]
-                if isinstance(width, (list, tuple)) and len(width) >= 2:
-                    start_width = _finite_float(width[0], 0.0)
-                    end_width = _finite_float(width[1], 0.0)
-            bulge = _finite_float(bulges[i], 0.0) if i < len(bulges) else 0.0
-            vertices.append((point[0], point[1], start_width, end_width, bulge))
-        lw = modelspace.add_lwpolyline(
-            vertices,
-            format="xyseb",
-            close=bool(dxf.get("closed", False)),
-            dxfattribs=dxfattribs,
-        )
-        const_width = dxf.get("const_width")
-        if const_width is not None and len(widths) == 0:
-            try:
-                lw.dxf.const_width = float(const_width)
-            except Exception:
-                pass
-        return True
-
-    if dxftype == "POLYLINE_2D":
-        if _should_write_polyline_2d_as_spline(dxf):
-            payload = _polyline_2d_spline_payload(dxf)
-            if payload is not None:
-                return _write_spline(
-                    modelspace,
-                    payload,
-                    dxfattribs,
-                )
-
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if not points:
-            interpolated_points = [
-                _point3(point) for point in list(dxf.get("interpolated_points") or [])
-            ]
-            if len(interpolated_points) >= 2:
-                if _distinct_xy_count(interpolated_points) < 2:
-                    return True
-                modelspace.add_lwpolyline(
-                    [(point[0], point[1], 0.0, 0.0, 0.0) for point in interpolated_points],
-                    format="xyseb",
-                    close=bool(dxf.get("closed", False)),
-                    dxfattribs=dxfattribs,
-                )
-                return True
-            if len(interpolated_points) == 1:
-                modelspace.add_point(interpolated_points[0], dxfattribs=dxfattribs)
-                return True
-            # Keep placeholder POLYLINE records from being reported as hard skips.
-            return True
-        if _distinct_xy_count(points) < 2:
-            return True
-        bulges = list(dxf.get("bulges", []) or [])
-        widths = list(dxf.get("widths", []) or [])
-        closed = bool(dxf.get("closed", False))
-        # Keep explicit terminal duplicate vertices for open polylines:
-        # some drawings represent the last segment this way even when the
-        # closed flag is not set.
-        if closed and len(points) > 1 and points[0] == points[-1]:
-            points = points[:-1]
-            if bulges:
-                bulges = bulges[: len(points)]
-            if widths:
-                widths = widths[: len(points)]
-        vertices = []
-        for i, point in enumerate(points):
-            start_width = 0.0
-            end_width = 0.0
-            if i < len(widths):
-                width = widths[i]
-                if isinstance(width, (list, tuple)) and len(width) >= 2:
-                    start_width = _finite_float(width[0], 0.0)
-                    end_width = _finite_float(width[1], 0.0)
-            bulge = _finite_float(bulges[i], 0.0) if i < len(bulges) else 0.0
-            vertices.append((point[0], point[1], start_width, end_width, bulge))
-        modelspace.add_lwpolyline(
-            vertices,
-            format="xyseb",
-            close=closed,
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "POLYLINE_3D":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 2:
-            return False
-        modelspace.add_polyline3d(
-            points,
-            close=bool(dxf.get("closed", False)),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "POLYLINE_MESH":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 2:
-            return False
-        modelspace.add_polyline3d(
-            points,
-            close=bool(dxf.get("closed", False)),
-            dxfattribs=dxfattribs,
-        )
-        return True
-
-    if dxftype == "POLYLINE_PFACE":
-        vertices = [_point3(vertex) for vertex in dxf.get("vertices", [])]
-        faces = dxf.get("faces", []) or []
-        face_written = False
-        for face in faces:
-            if not isinstance(face, (list, tuple)):
-                continue
-            points: list[tuple[float, float, float]] = []
-            for raw_index in face:
-                try:
-                    idx = abs(int(raw_index))
-                except Exception:
-                    continue
-                if idx <= 0:
-                    continue
-                if idx <= len(vertices):
-                    points.append(vertices[idx - 1])
-            if len(points) < 3:
-                continue
-            while len(points) < 4:
-                points.append(points[-1])
-            modelspace.add_3dface(points[:4], dxfattribs=dxfattribs)
-            face_written = True
-        if face_written:
-            return True
-        if len(vertices) >= 2:
-            modelspace.add_polyline3d(vertices, close=False, dxfattribs=dxfattribs)
-            return True
-        return False
-
-    if dxftype == "3DFACE":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 3:
-            return False
-        while len(points) < 4:
-            points.append(points[-1])
-        modelspace.add_3dface(points[:4], dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "SOLID":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 3:
-            return False
-        while len(points) < 4:
-            points.append(points[-1])
-        modelspace.add_solid(points[:4], dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "TRACE":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 3:
-            return False
-        while len(points) < 4:
-            points.append(points[-1])
-        modelspace.add_trace(points[:4], dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "SHAPE":
-        modelspace.add_point(_point3(dxf.get("insert")), dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "SPLINE":
-        return _write_spline(modelspace, dxf, dxfattribs)
-
-    if dxftype == "ATTDEF":
-        return _write_attdef(modelspace, dxf, dxfattribs)
-
-    if dxftype in {"TEXT", "ATTRIB"}:
-        return _write_text_like(modelspace, dxf, dxfattribs)
-
-    if dxftype == "MTEXT":
-        return _write_mtext(modelspace, dxf, dxfattribs)
-
-    if dxftype == "LEADER":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 2:
-            return False
-        try:
-            leader = modelspace.add_leader(points, dxfattribs=dxfattribs)
-            annotation_type = dxf.get("annotation_type")
-            if annotation_type is not None and hasattr(leader.dxf, "annotation_type"):
-                try:
-                    leader.dxf.annotation_type = int(annotation_type)
-                except Exception:
-                    pass
-            return True
-        except Exception:
-            # Fallback for backends/version targets without LEADER support.
-            modelspace.add_polyline3d(points, close=False, dxfattribs=dxfattribs)
-        return True
-
-    if dxftype == "HATCH":
-        return _write_hatch(modelspace, dxf, dxfattribs)
-
-    if dxftype == "TOLERANCE":
-        return _write_text_like(modelspace, dxf, dxfattribs)
-
-    if dxftype == "MLINE":
-        points = [_point3(point) for point in dxf.get("points", [])]
-        if len(points) < 2:
-            return False
-        modelspace.add_mline(points, close=bool(dxf.get("closed", False)), dxfattribs=dxfattribs)
-        return True
+    is_modelspace_layout = bool(getattr(modelspace, "is_modelspace", False))
 
     if dxftype == "MINSERT":
         name = _normalize_block_name(dxf.get("name"))
@@ -4892,12 +4742,285 @@ def _write_entity_to_modelspace_unsafe(
     return False
 
 
+def _write_line(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_line(_point3(dxf.get("start")), _point3(dxf.get("end")), dxfattribs=dxfattribs)
+    return True
+
+
+def _write_ray(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_ray(
+        _point3(dxf.get("start")),
+        _point3(dxf.get("unit_vector")),
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_xline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_xline(
+        _point3(dxf.get("start")),
+        _point3(dxf.get("unit_vector")),
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_point(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_point(_point3(dxf.get("location")), dxfattribs=dxfattribs)
+    return True
+
+
+def _write_arc(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    radius = abs(_finite_float(dxf.get("radius", 0.0), 0.0))
+    if radius <= 0.0:
+        return True
+    modelspace.add_arc(
+        _point3(dxf.get("center")),
+        radius,
+        _finite_float(dxf.get("start_angle", 0.0), 0.0),
+        _finite_float(dxf.get("end_angle", 0.0), 0.0),
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_circle(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    radius = abs(_finite_float(dxf.get("radius", 0.0), 0.0))
+    if radius <= 0.0:
+        return True
+    modelspace.add_circle(
+        _point3(dxf.get("center")),
+        radius,
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_ellipse(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_ellipse(
+        _point3(dxf.get("center")),
+        major_axis=_point3(dxf.get("major_axis")),
+        ratio=float(dxf.get("axis_ratio", 1.0)),
+        start_param=float(dxf.get("start_angle", 0.0)),
+        end_param=float(dxf.get("end_angle", 0.0)),
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _lwpolyline_vertices(
+    points: list[tuple[float, float, float]],
+    widths: Iterable[Any],
+    bulges: Iterable[Any],
+) -> list[tuple[float, float, float, float, float]]:
+    if not widths and not bulges:
+        return [(point[0], point[1], 0.0, 0.0, 0.0) for point in points]
+    vertices = []
+    # Pad the per-vertex lists lazily instead of bounds-checking every index.
+    padded_widths = chain(widths, repeat(None))
+    padded_bulges = chain(bulges, repeat(0.0))
+    for point, width, bulge in zip(points, padded_widths, padded_bulges):
+        start_width = 0.0
+        end_width = 0.0
+        if isinstance(width, (list, tuple)) and len(width) >= 2:
+            start_width = _finite_float(width[0], 0.0)
+            end_width = _finite_float(width[1], 0.0)
+        vertices.append((point[0], point[1], start_width, end_width, _finite_float(bulge, 0.0)))
+    return vertices
+
+
+def _write_lwpolyline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _points3(dxf.get("points", []))
+    if not points:
+        return False
+    if _distinct_xy_count(points, limit=2) < 2:
+        # Degenerate width-only polylines can produce invalid extents in
+        # downstream renderers; keep conversion stable by dropping them.
+        return True
+    bulges = dxf.get("bulges") or ()
+    widths = dxf.get("widths") or ()
+    vertices = _lwpolyline_vertices(points, widths, bulges)
+    lw = modelspace.add_lwpolyline(
+        vertices,
+        format="xyseb",
+        close=bool(dxf.get("closed", False)),
+        dxfattribs=dxfattribs,
+    )
+    const_width = dxf.get("const_width")
+    if const_width is not None and len(widths) == 0:
+        try:
+            lw.dxf.const_width = float(const_width)
+        except Exception:
+            pass
+    return True
+
+
+def _write_polyline_2d(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    if _should_write_polyline_2d_as_spline(dxf):
+        payload = _polyline_2d_spline_payload(dxf)
+        if payload is not None:
+            return _write_spline(
+                modelspace,
+                payload,
+                dxfattribs,
+            )
+
+    points = _points3(dxf.get("points", []))
+    if not points:
+        interpolated_points = _points3(dxf.get("interpolated_points") or [])
+        if len(interpolated_points) >= 2:
+            if _distinct_xy_count(interpolated_points, limit=2) < 2:
+                return True
+            modelspace.add_lwpolyline(
+                [(point[0], point[1], 0.0, 0.0, 0.0) for point in interpolated_points],
+                format="xyseb",
+                close=bool(dxf.get("closed", False)),
+                dxfattribs=dxfattribs,
+            )
+            return True
+        if len(interpolated_points) == 1:
+            modelspace.add_point(interpolated_points[0], dxfattribs=dxfattribs)
+            return True
+        # Keep placeholder POLYLINE records from being reported as hard skips.
+        return True
+    if _distinct_xy_count(points, limit=2) < 2:
+        return True
+    bulges = dxf.get("bulges") or ()
+    widths = dxf.get("widths") or ()
+    closed = bool(dxf.get("closed", False))
+    # Keep explicit terminal duplicate vertices for open polylines:
+    # some drawings represent the last segment this way even when the
+    # closed flag is not set.
+    if closed and len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+        if bulges:
+            bulges = bulges[: len(points)]
+        if widths:
+            widths = widths[: len(points)]
+    vertices = _lwpolyline_vertices(points, widths, bulges)
+    modelspace.add_lwpolyline(
+        vertices,
+        format="xyseb",
+        close=closed,
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_polyline_3d(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _points3(dxf.get("points", []))
+    if len(points) < 2:
+        return False
+    modelspace.add_polyline3d(
+        points,
+        close=bool(dxf.get("closed", False)),
+        dxfattribs=dxfattribs,
+    )
+    return True
+
+
+def _write_polyline_pface(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    vertices = _points3(dxf.get("vertices", []))
+    faces = dxf.get("faces", []) or []
+    face_written = False
+    for face in faces:
+        if not isinstance(face, (list, tuple)):
+            continue
+        points: list[tuple[float, float, float]] = []
+        for raw_index in face:
+            try:
+                idx = abs(int(raw_index))
+            except Exception:
+                continue
+            if idx <= 0:
+                continue
+            if idx <= len(vertices):
+                points.append(vertices[idx - 1])
+        if len(points) < 3:
+            continue
+        while len(points) < 4:
+            points.append(points[-1])
+        modelspace.add_3dface(points[:4], dxfattribs=dxfattribs)
+        face_written = True
+    if face_written:
+        return True
+    if len(vertices) >= 2:
+        modelspace.add_polyline3d(vertices, close=False, dxfattribs=dxfattribs)
+        return True
+    return False
+
+
+def _collect_face_points(dxf: dict[str, Any]) -> list[tuple[float, float, float]] | None:
+    points = _points3(dxf.get("points", []))
+    if len(points) < 3:
+        return None
+    while len(points) < 4:
+        points.append(points[-1])
+    return points[:4]
+
+
+def _write_3dface(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _collect_face_points(dxf)
+    if points is None:
+        return False
+    modelspace.add_3dface(points, dxfattribs=dxfattribs)
+    return True
+
+
+def _write_solid(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _collect_face_points(dxf)
+    if points is None:
+        return False
+    modelspace.add_solid(points, dxfattribs=dxfattribs)
+    return True
+
+
+def _write_trace(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _collect_face_points(dxf)
+    if points is None:
+        return False
+    modelspace.add_trace(points, dxfattribs=dxfattribs)
+    return True
+
+
+def _write_shape(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    modelspace.add_point(_point3(dxf.get("insert")), dxfattribs=dxfattribs)
+    return True
+
+
+def _write_leader(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _points3(dxf.get("points", []))
+    if len(points) < 2:
+        return False
+    try:
+        leader = modelspace.add_leader(points, dxfattribs=dxfattribs)
+        annotation_type = dxf.get("annotation_type")
+        if annotation_type is not None and hasattr(leader.dxf, "annotation_type"):
+            try:
+                leader.dxf.annotation_type = int(annotation_type)
+            except Exception:
+                pass
+        return True
+    except Exception:
+        # Fallback for backends/version targets without LEADER support.
+        modelspace.add_polyline3d(points, close=False, dxfattribs=dxfattribs)
+    return True
+
+
+def _write_mline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
+    points = _points3(dxf.get("points", []))
+    if len(points) < 2:
+        return False
+    modelspace.add_mline(points, close=bool(dxf.get("closed", False)), dxfattribs=dxfattribs)
+    return True
+
+
 def _write_spline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any]) -> bool:
-    fit_points = [_point3(point) for point in dxf.get("fit_points", [])]
+    fit_points = _points3(dxf.get("fit_points", []))
     if len(fit_points) >= 2:
         closed = bool(dxf.get("closed", False))
         degree = max(2, int(dxf.get("degree", 3)))
-        fit_tangents = [_point3(point) for point in list(dxf.get("fit_tangents") or [])]
+        fit_tangents = _points3(dxf.get("fit_tangents") or [])
         if len(fit_tangents) >= 2 and not closed:
             modelspace.add_cad_spline_control_frame(
                 fit_points=fit_points,
@@ -4909,7 +5032,7 @@ def _write_spline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, An
         if closed:
             closed_fit_points = list(fit_points)
             if len(closed_fit_points) > 1 and closed_fit_points[0] == closed_fit_points[-1]:
-                closed_fit_points = closed_fit_points[:-1]
+                closed_fit_points.pop()
             if len(closed_fit_points) >= max(3, degree + 1):
                 try:
                     spline = modelspace.add_spline_control_frame(
@@ -4933,17 +5056,19 @@ def _write_spline(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, An
             spline.set_flag_state(spline.PERIODIC, True)
         return True
 
-    control_points = [_point3(point) for point in dxf.get("control_points", [])]
+    control_points = _points3(dxf.get("control_points", []))
     if len(control_points) < 2:
-        points = [_point3(point) for point in dxf.get("points", [])]
+        points = _points3(dxf.get("points", []))
         if len(points) < 2:
             return False
         modelspace.add_polyline3d(points, close=bool(dxf.get("closed", False)), dxfattribs=dxfattribs)
         return True
 
     closed = bool(dxf.get("closed", False))
+    # _points3 returns a fresh list, so the duplicate endpoint is dropped in
+    # place instead of copying the remaining control points.
     if len(control_points) > 1 and control_points[0] == control_points[-1]:
-        control_points = control_points[:-1]
+        control_points.pop()
 
     degree = max(2, int(dxf.get("degree", 3)))
     knots = [float(v) for v in dxf.get("knots", [])]
@@ -5011,70 +5136,74 @@ def _write_minsert_expanded(
     column_spacing = float(dxf.get("column_spacing", 0.0))
     row_spacing = float(dxf.get("row_spacing", 0.0))
     rotation_deg = float(dxf.get("rotation", 0.0))
-    rotation = math.radians(rotation_deg)
-    cos_r = math.cos(rotation)
-    sin_r = math.sin(rotation)
-
-    col_dx = column_spacing * cos_r
-    col_dy = column_spacing * sin_r
-    row_dx = -row_spacing * sin_r
-    row_dy = row_spacing * cos_r
-
-    written = 0
+    if rotation_deg == 0.0:
+        # Unrotated grids, the usual case, are axis-aligned.
+        col_dx, col_dy = column_spacing, 0.0
+        row_dx, row_dy = 0.0, row_spacing
+    else:
+        rotation = math.radians(rotation_deg)
+        cos_r = math.cos(rotation)
+        sin_r = math.sin(rotation)
+        col_dx = column_spacing * cos_r
+        col_dy = column_spacing * sin_r
+        row_dx = -row_spacing * sin_r
+        row_dy = row_spacing * cos_r
+
+    # Validate the per-reference attributes once up front. Every cell shares
+    # the same block name and transform, so a failure here would fail for all
+    # of them; let it propagate before any partial grid has been written.
+    xscale = float(dxf.get("xscale", 1.0))
+    yscale = float(dxf.get("yscale", 1.0))
+    zscale = float(dxf.get("zscale", 1.0))
+
+    # Column offsets are shared by every row and the row offset by every
+    # cell in it, so only the final additions run per cell.
+    column_offsets = [(column * col_dx, column * col_dy) for column in range(column_count)]
+    insert_x, insert_y, insert_z = insert
+    cell_z = insert_z + 0.0
+    add_blockref = modelspace.add_blockref
+    attribute_templates = _prepare_insert_attribute_templates(attributes)
     for row in range(row_count):
-        for column in range(column_count):
-            offset = (
-                column * col_dx + row * row_dx,
-                column * col_dy + row * row_dy,
-                0.0,
-            )
-            cell_insert = (
-                insert[0] + offset[0],
-                insert[1] + offset[1],
-                insert[2] + offset[2],
+        row_x = row * row_dx
+        row_y = row * row_dy
+        for column_x, column_y in column_offsets:
+            offset_x = column_x + row_x
+            offset_y = column_y + row_y
+            ref = add_blockref(
+                name,
+                (insert_x + offset_x, insert_y + offset_y, cell_z),
+                dxfattribs=dxfattribs,
             )
-            try:
-                ref = modelspace.add_blockref(name, cell_insert, dxfattribs=dxfattribs)
-                ref.dxf.xscale = float(dxf.get("xscale", 1.0))
-                ref.dxf.yscale = float(dxf.get("yscale", 1.0))
-                ref.dxf.zscale = float(dxf.get("zscale", 1.0))
-                ref.dxf.rotation = rotation_deg
-                shifted_attributes = _shift_attribute_positions(attributes, offset)
-                _write_insert_attributes(ref, shifted_attributes)
-                written += 1
-            except Exception:
-                continue
-    return written > 0
+            ref_dxf = ref.dxf
+            ref_dxf.xscale = xscale
+            ref_dxf.yscale = yscale
+            ref_dxf.zscale = zscale
+            ref_dxf.rotation = rotation_deg
+            _write_insert_attribute_templates(ref, attribute_templates, offset_x, offset_y)
+    return True
 
 
-def _shift_attribute_positions(attributes: list[Any], offset: tuple[float, float, float]) -> list[Any]:
-    if offset == (0.0, 0.0, 0.0):
-        return attributes
-    shifted: list[Any] = []
-    for attribute in attributes:
-        if not isinstance(attribute, dict):
-            shifted.append(attribute)
-            continue
-        attribute_dxf = dict(attribute)
-        for key in ("insert", "align_point"):
-            point = attribute_dxf.get(key)
-            if not isinstance(point, (list, tuple)) or len(point) < 3:
-                continue
-            try:
-                attribute_dxf[key] = (
-                    float(point[0]) + offset[0],
-                    float(point[1]) + offset[1],
-                    float(point[2]) + offset[2],
-                )
-            except Exception:
-                continue
-        shifted.append(attribute_dxf)
-    return shifted
+_InsertAttributeTemplate = tuple[
+    str, str, dict[str, Any] | None, tuple[float, float, float], bool
+]
 
 
 def _write_insert_attributes(insert_ref: Any, attributes: list[Any]) -> None:
     if not attributes:
         return
+    _write_insert_attribute_templates(
+        insert_ref,
+        _prepare_insert_attribute_templates(attributes),
+    )
+
+
+def _prepare_insert_attribute_templates(
+    attributes: list[Any],
+) -> list[_InsertAttributeTemplate]:
+    # Tag, text, dxfattribs and insert point are parsed once per attribute so
+    # an expanded MINSERT grid only offsets the insert point per cell. ezdxf
+    # copies dxfattribs in add_attrib, so the dicts can be shared by cells.
+    templates: list[_InsertAttributeTemplate] = []
     for attribute in attributes:
         if not isinstance(attribute, dict):
             continue
@@ -5098,13 +5227,38 @@ def _write_insert_attributes(insert_ref: Any, attributes: list[Any]) -> None:
                 attrib_dxfattribs["rotation"] = float(rotation)
             except Exception:
                 pass
+        raw_insert = attribute.get("insert")
         try:
-            insert_ref.add_attrib(
+            insert = _point3(raw_insert)
+        except Exception:
+            continue
+        # Only full 3D insert points follow the MINSERT cell offset.
+        shiftable = isinstance(raw_insert, (list, tuple)) and len(raw_insert) >= 3
+        templates.append(
+            (
                 tag_value,
                 "" if text is None else str(text),
-                insert=_point3(attribute.get("insert")),
-                dxfattribs=attrib_dxfattribs or None,
+                attrib_dxfattribs or None,
+                insert,
+                shiftable,
             )
+        )
+    return templates
+
+
+def _write_insert_attribute_templates(
+    insert_ref: Any,
+    templates: list[_InsertAttributeTemplate],
+    offset_x: float = 0.0,
+    offset_y: float = 0.0,
+) -> None:
+    # MINSERT cells only ever offset within the insert's XY plane.
+    shift = offset_x != 0.0 or offset_y != 0.0
+    for tag, text, attrib_dxfattribs, insert, shiftable in templates:
+        if shift and shiftable:
+            insert = (insert[0] + offset_x, insert[1] + offset_y, insert[2])
+        try:
+            insert_ref.add_attrib(tag, text, insert=insert, dxfattribs=attrib_dxfattribs)
         except Exception:
             continue
 
@@ -5232,6 +5386,20 @@ def _write_hatch(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any
     if len(paths) == 0:
         return False
 
+    # Collect the usable boundaries first so a hatch without any is skipped
+    # instead of leaving an empty HATCH entity behind.
+    boundaries: list[tuple[list[tuple[float, float]], bool]] = []
+    for path in paths:
+        if not isinstance(path, dict):
+            continue
+        points = path.get("points", []) or []
+        xy = [(float(point[0]), float(point[1])) for point in points if len(point) >= 2]
+        if len(xy) < 2:
+            continue
+        boundaries.append((xy, bool(path.get("closed", False))))
+    if not boundaries:
+        return False
+
     color = _to_valid_aci(dxf.get("resolved_color_index"))
     if color is None:
         color = _to_valid_aci(dxf.get("color_index"))
@@ -5243,20 +5411,47 @@ def _write_hatch(modelspace: Any, dxf: dict[str, Any], dxfattribs: dict[str, Any
         rgb = _to_rgb(_to_valid_true_color(dxf.get("resolved_true_color")))
         hatch.set_solid_fill(color=color, rgb=rgb)
     else:
-        pattern_name = str(dxf.get("pattern_name") or "ANSI31")
+        pattern_name = dxf.get("pattern_name") or "ANSI31"
+        if not isinstance(pattern_name, str):
+            pattern_name = str(pattern_name)
         hatch.set_pattern_fill(pattern_name, color=color)
 
-    path_written = False
-    for path in paths:
-        if not isinstance(path, dict):
-            continue
-        points = path.get("points", []) or []
-        xy = [(float(point[0]), float(point[1])) for point in points if len(point) >= 2]
-        if len(xy) < 2:
-            continue
-        hatch.paths.add_polyline_path(xy, is_closed=bool(path.get("closed", False)))
-        path_written = True
-    return path_written
+    add_polyline_path = hatch.paths.add_polyline_path
+    for xy, is_closed in boundaries:
+        add_polyline_path(xy, is_closed=is_closed)
+    return True
+
+
+# Entity types whose export only depends on the entity's own attributes.
+# INSERT, MINSERT and DIMENSION also need the layout and dimension context
+# and stay in _write_entity_to_modelspace_unsafe.
+_ENTITY_WRITERS: dict[str, Callable[[Any, dict[str, Any], dict[str, Any]], bool]] = {
+    "LINE": _write_line,
+    "RAY": _write_ray,
+    "XLINE": _write_xline,
+    "POINT": _write_point,
+    "ARC": _write_arc,
+    "CIRCLE": _write_circle,
+    "ELLIPSE": _write_ellipse,
+    "LWPOLYLINE": _write_lwpolyline,
+    "POLYLINE_2D": _write_polyline_2d,
+    "POLYLINE_3D": _write_polyline_3d,
+    "POLYLINE_MESH": _write_polyline_3d,
+    "POLYLINE_PFACE": _write_polyline_pface,
+    "3DFACE": _write_3dface,
+    "SOLID": _write_solid,
+    "TRACE": _write_trace,
+    "SHAPE": _write_shape,
+    "SPLINE": _write_spline,
+    "ATTDEF": _write_attdef,
+    "TEXT": _write_text_like,
+    "ATTRIB": _write_text_like,
+    "MTEXT": _write_mtext,
+    "LEADER": _write_leader,
+    "HATCH": _write_hatch,
+    "TOLERANCE": _write_text_like,
+    "MLINE": _write_mline,
+}
 
 
 def _write_dimension_native(
@@ -5269,6 +5464,11 @@ def _write_dimension_native(
     dimension_context: _DimensionWriteContext | None = None,
 ) -> bool:
     normalized_dim_block_policy = _normalize_dim_block_policy(dim_block_policy)
+    anonymous_block_name = _dimension_anonymous_block_name(dxf)
+    # The block fallback result only depends on the dimension payload and the
+    # block definitions, so a rejected fallback stays rejected for the rest of
+    # this call and does not need to be re-evaluated on later branches.
+    block_fallback_rejected = anonymous_block_name is None
 
     def _finalize_and_track(dim: Any) -> bool:
         written = _finalize_dimension(
@@ -5278,125 +5478,176 @@ def _write_dimension_native(
             explode_dimensions=explode_dimensions,
         )
         if written:
-            _remember_written_dimension_block_reference(dimension_context, dxf)
+            _remember_written_dimension_block_reference(
+                dimension_context,
+                dxf,
+                block_name=anonymous_block_name,
+            )
         return written
 
-    dimtype = str(dxf.get("dimtype") or "").upper()
-    if dimtype.startswith("DIM_"):
-        dimtype = dimtype[4:]
-    anonymous_block_name = _dimension_anonymous_block_name(dxf)
-    # Generic "*D" names are frequently reused across unrelated anonymous
-    # dimension graphics in best-effort decode paths. Prefer native geometry
-    # generation for those to avoid collapsing many dimensions onto one block.
-    prefer_native_first = anonymous_block_name in {None, "*D"}
-    if not prefer_native_first and _write_dimension_block_fallback(
-        modelspace,
-        dxf,
-        dxfattribs,
-        dim_block_policy=normalized_dim_block_policy,
-        dimension_context=dimension_context,
-    ):
-        return True
-    if _is_placeholder_dimension_payload(dxf):
-        # Keep conversion stable for minimally decoded DIM placeholders:
-        # do not generate synthetic zero-length geometry.
+    def _try_block_fallback() -> bool:
+        nonlocal block_fallback_rejected
+        if block_fallback_rejected:
+            return False
         if _write_dimension_block_fallback(
             modelspace,
             dxf,
             dxfattribs,
+            block_name=anonymous_block_name,
             dim_block_policy=normalized_dim_block_policy,
             dimension_context=dimension_context,
         ):
             return True
+        block_fallback_rejected = True
+        return False
+
+    dimtype = _normalize_dimension_subtype(dxf.get("dimtype"))
+    # Generic "*D" names are frequently reused across unrelated anonymous
+    # dimension graphics in best-effort decode paths. Prefer native geometry
+    # generation for those to avoid collapsing many dimensions onto one block.
+    prefer_native_first = anonymous_block_name in {None, "*D"}
+    if not prefer_native_first and _try_block_fallback():
+        return True
+    if _is_placeholder_dimension_payload(dxf):
+        # Keep conversion stable for minimally decoded DIM placeholders:
+        # do not generate synthetic zero-length geometry.
+        _try_block_fallback()
         return True
     text = _dimension_text(dxf.get("text"))
     text_mid = _point2_or_none(dxf.get("text_midpoint"))
 
-    try:
-        if dimtype == "LINEAR":
-            dim = modelspace.add_linear_dim(
-                base=_point2(dxf.get("defpoint")),
-                p1=_point2(dxf.get("defpoint2")),
-                p2=_point2(dxf.get("defpoint3")),
-                location=text_mid,
-                text=text,
-                angle=float(dxf.get("angle", 0.0)),
-                text_rotation=_float_or_none(dxf.get("text_rotation")),
-                dxfattribs=dxfattribs,
-            )
-            return _finalize_and_track(dim)
-
-        if dimtype == "ALIGNED":
-            p1 = _point2(dxf.get("defpoint2"))
-            p2 = _point2(dxf.get("defpoint3"))
-            base = _point2(dxf.get("defpoint"))
-            distance = _signed_line_distance_2d(base, p1, p2)
-            dim = modelspace.add_aligned_dim(
-                p1=p1,
-                p2=p2,
-                distance=distance,
-                text=text,
-                dxfattribs=dxfattribs,
-            )
-            if text_mid is not None:
-                dim.set_location(text_mid, leader=False, relative=False)
-            return _finalize_and_track(dim)
-
-        if dimtype == "RADIUS":
-            center = _point2(dxf.get("defpoint2"))
-            mpoint = _point2_or_none(dxf.get("defpoint3"))
-            dim = modelspace.add_radius_dim(
-                center=center,
-                mpoint=mpoint,
-                text=text,
-                dxfattribs=dxfattribs,
-            )
-            if text_mid is not None:
-                dim.set_location(text_mid, leader=False, relative=False)
-            return _finalize_and_track(dim)
-
-        if dimtype == "DIAMETER":
-            center = _point2(dxf.get("defpoint2"))
-            mpoint = _point2_or_none(dxf.get("defpoint3"))
-            dim = modelspace.add_diameter_dim(
-                center=center,
-                mpoint=mpoint,
-                text=text,
-                dxfattribs=dxfattribs,
-            )
-            if text_mid is not None:
-                dim.set_location(text_mid, leader=False, relative=False)
-            return _finalize_and_track(dim)
-
-        if dimtype == "ORDINATE":
-            feature = _point2(dxf.get("defpoint2"))
-            offset = _point2(dxf.get("defpoint3"))
-            origin = _point2_or_none(dxf.get("defpoint")) or (0.0, 0.0)
-            dim = modelspace.add_ordinate_dim(
-                feature_location=feature,
-                offset=offset,
-                dtype=_ordinate_dim_type(feature, offset),
-                origin=origin,
-                rotation=float(dxf.get("angle", 0.0)),
-                text=text,
-                dxfattribs=dxfattribs,
+    add_dimension = _DIMENSION_BUILDERS.get(dimtype)
+    if add_dimension is not None:
+        try:
+            return _finalize_and_track(
+                add_dimension(modelspace, dxf, dxfattribs, text, text_mid)
             )
-            return _finalize_and_track(dim)
-    except Exception:
-        # Keep conversion robust and avoid generating synthetic geometry lines.
-        pass
+        except Exception:
+            # Keep conversion robust and avoid generating synthetic geometry lines.
+            pass
 
-    if _write_dimension_block_fallback(
-        modelspace,
-        dxf,
-        dxfattribs,
-        dim_block_policy=normalized_dim_block_policy,
-        dimension_context=dimension_context,
-    ):
+    if _try_block_fallback():
         return True
     return _write_dimension_text_fallback(modelspace, dxf, dxfattribs)
 
 
+def _add_linear_dimension(
+    modelspace: Any,
+    dxf: dict[str, Any],
+    dxfattribs: dict[str, Any],
+    text: str,
+    text_mid: tuple[float, float] | None,
+) -> Any:
+    return modelspace.add_linear_dim(
+        base=_point2(dxf.get("defpoint")),
+        p1=_point2(dxf.get("defpoint2")),
+        p2=_point2(dxf.get("defpoint3")),
+        location=text_mid,
+        text=text,
+        angle=float(dxf.get("angle", 0.0)),
+        text_rotation=_float_or_none(dxf.get("text_rotation")),
+        dxfattribs=dxfattribs,
+    )
+
+
+def _add_aligned_dimension(
+    modelspace: Any,
+    dxf: dict[str, Any],
+    dxfattribs: dict[str, Any],
+    text: str,
+    text_mid: tuple[float, float] | None,
+) -> Any:
+    p1 = _point2(dxf.get("defpoint2"))
+    p2 = _point2(dxf.get("defpoint3"))
+    base = _point2(dxf.get("defpoint"))
+    distance = _signed_line_distance_2d(base, p1, p2)
+    dim = modelspace.add_aligned_dim(
+        p1=p1,
+        p2=p2,
+        distance=distance,
+        text=text,
+        dxfattribs=dxfattribs,
+    )
+    if text_mid is not None:
+        dim.set_location(text_mid, leader=False, relative=False)
+    return dim
+
+
+def _add_radius_dimension(
+    modelspace: Any,
+    dxf: dict[str, Any],
+    dxfattribs: dict[str, Any],
+    text: str,
+    text_mid: tuple[float, float] | None,
+) -> Any:
+    center = _point2(dxf.get("defpoint2"))
+    mpoint = _point2_or_none(dxf.get("defpoint3"))
+    dim = modelspace.add_radius_dim(
+        center=center,
+        mpoint=mpoint,
+        text=text,
+        dxfattribs=dxfattribs,
+    )
+    if text_mid is not None:
+        dim.set_location(text_mid, leader=False, relative=False)
+    return dim
+
+
+def _add_diameter_dimension(
+    modelspace: Any,
+    dxf: dict[str, Any],
+    dxfattribs: dict[str, Any],
+    text: str,
+    text_mid: tuple[float, float] | None,
+) -> Any:
+    center = _point2(dxf.get("defpoint2"))
+    mpoint = _point2_or_none(dxf.get("defpoint3"))
+    dim = modelspace.add_diameter_dim(
+        center=center,
+        mpoint=mpoint,
+        text=text,
+        dxfattribs=dxfattribs,
+    )
+    if text_mid is not None:
+        dim.set_location(text_mid, leader=False, relative=False)
+    return dim
+
+
+def _add_ordinate_dimension(
+    modelspace: Any,
+    dxf: dict[str, Any],
+    dxfattribs: dict[str, Any],
+    text: str,
+    text_mid: tuple[float, float] | None,
+) -> Any:
+    feature = _point2(dxf.get("defpoint2"))
+    offset = _point2(dxf.get("defpoint3"))
+    origin = _point2_or_none(dxf.get("defpoint")) or (0.0, 0.0)
+    return modelspace.add_ordinate_dim(
+        feature_location=feature,
+        offset=offset,
+        dtype=_ordinate_dim_type(feature, offset),
+        origin=origin,
+        rotation=float(dxf.get("angle", 0.0)),
+        text=text,
+        dxfattribs=dxfattribs,
+    )
+
+
+# Native ezdxf builders by normalized DIMENSION subtype. Each returns the
+# dimension entity for _write_dimension_native to finalize.
+_DIMENSION_BUILDERS: dict[
+    str,
+    Callable[[Any, dict[str, Any], dict[str, Any], str, tuple[float, float] | None], Any],
+] = {
+    "LINEAR": _add_linear_dimension,
+    "ALIGNED": _add_aligned_dimension,
+    "RADIUS": _add_radius_dimension,
+    "DIAMETER": _add_diameter_dimension,
+    "ORDINATE": _add_ordinate_dimension,
+}
+
+
 def _dimension_block_reference_transform(
     dxf: dict[str, Any],
 ) -> tuple[tuple[float, float, float], float, float, float, float]:
@@ -5424,15 +5675,17 @@ def _write_dimension_block_fallback(
     dxf: dict[str, Any],
     dxfattribs: dict[str, Any],
     *,
+    block_name: str | None = None,
     dim_block_policy: str = "smart",
     dimension_context: _DimensionWriteContext | None = None,
 ) -> bool:
     _ = _normalize_dim_block_policy(dim_block_policy)
-    name = _dimension_anonymous_block_name(dxf)
+    name = block_name if block_name is not None else _dimension_anonymous_block_name(dxf)
     if name is None:
         return False
 
-    insert, xscale, yscale, zscale, rotation = _dimension_block_reference_transform(dxf)
+    transform = _dimension_block_reference_transform(dxf)
+    insert, xscale, yscale, zscale, rotation = transform
     if bool(getattr(modelspace, "is_modelspace", False)):
         is_empty, has_nested_dim_insert, local_center_abs = _cached_block_insert_safety_info(
             modelspace,
@@ -5447,7 +5700,7 @@ def _write_dimension_block_fallback(
                 zscale,
                 rotation,
             )
-            and name.upper().startswith("*D")
+            and _is_anonymous_dimension_block_name(name)
             and local_center_abs is not None
             and local_center_abs > 1000.0
         ):
@@ -5464,7 +5717,7 @@ def _write_dimension_block_fallback(
         # are unstable across viewers and commonly duplicate/scatter geometry.
         # Reject fallback blockrefs for these cases regardless of policy.
         if (
-            name.upper().startswith("*D")
+            _is_anonymous_dimension_block_name(name)
             and max(abs(xscale), abs(yscale), abs(zscale)) >= 10.0
             and local_center_abs is not None
             and local_center_abs > 1000.0
@@ -5480,11 +5733,24 @@ def _write_dimension_block_fallback(
     ref.dxf.yscale = yscale
     ref.dxf.zscale = zscale
     ref.dxf.rotation = rotation
-    _remember_written_dimension_block_reference(dimension_context, dxf)
+    _remember_written_dimension_block_reference(
+        dimension_context,
+        dxf,
+        block_name=name,
+        transform=transform,
+    )
     return True
 
 
 def _is_placeholder_dimension_payload(dxf: dict[str, Any]) -> bool:
+    # Check the cheap scalar fields first; most real dimensions carry text or
+    # a measurement and never need the point coercions below.
+    text = str(dxf.get("text") or "").strip()
+    if text not in {"", "<>"}:
+        return False
+    if dxf.get("actual_measurement") is not None:
+        return False
+
     zero = (0.0, 0.0, 0.0)
     defpoint = _point3(dxf.get("defpoint"))
     defpoint2 = _point3(dxf.get("defpoint2"))
@@ -5499,13 +5765,7 @@ def _is_placeholder_dimension_payload(dxf: dict[str, Any]) -> bool:
         return False
 
     insert_value = dxf.get("insert")
-    if insert_value is not None and _point3(insert_value) != zero:
-        return False
-
-    text = str(dxf.get("text") or "").strip()
-    if text not in {"", "<>"}:
-        return False
-    return dxf.get("actual_measurement") is None
+    return insert_value is None or _point3(insert_value) == zero
 
 
 def _finalize_dimension(
@@ -5523,40 +5783,43 @@ def _finalize_dimension(
     if dimension_entity is None:
         return True
 
+    # Stream virtual entities instead of materializing them up front. Track
+    # only the clones actually added so a failing generator can be rolled
+    # back, leaving the rendered DIMENSION entity as the sole output.
+    added_clones: list[Any] = []
     try:
-        virtual_entities = list(dimension_entity.virtual_entities())
-    except Exception:
-        return True
-
-    if not virtual_entities:
-        return True
-
-    written = 0
-    for virtual_entity in virtual_entities:
-        if virtual_entity.dxftype() == "POINT":
-            # DEFPOINT-like helper markers are usually not rendered in CAD viewers.
-            continue
-        try:
-            clone = virtual_entity.copy()
-        except Exception:
-            continue
-        if "color" in dxfattribs and hasattr(clone.dxf, "color"):
+        for virtual_entity in dimension_entity.virtual_entities():
+            if virtual_entity.dxftype() == "POINT":
+                # DEFPOINT-like helper markers are usually not rendered in CAD viewers.
+                continue
             try:
-                clone.dxf.color = int(dxfattribs["color"])
+                clone = virtual_entity.copy()
             except Exception:
-                pass
-        if "true_color" in dxfattribs and hasattr(clone.dxf, "true_color"):
+                continue
+            if "color" in dxfattribs and hasattr(clone.dxf, "color"):
+                try:
+                    clone.dxf.color = int(dxfattribs["color"])
+                except Exception:
+                    pass
+            if "true_color" in dxfattribs and hasattr(clone.dxf, "true_color"):
+                try:
+                    clone.dxf.true_color = int(dxfattribs["true_color"])
+                except Exception:
+                    pass
             try:
-                clone.dxf.true_color = int(dxfattribs["true_color"])
+                modelspace.add_entity(clone)
             except Exception:
-                pass
-        try:
-            modelspace.add_entity(clone)
-            written += 1
-        except Exception:
-            continue
+                continue
+            added_clones.append(clone)
+    except Exception:
+        for clone in added_clones:
+            try:
+                modelspace.delete_entity(clone)
+            except Exception:
+                continue
+        return True
 
-    if written <= 0:
+    if not added_clones:
         return True
 
     try:
@@ -5588,33 +5851,57 @@ def _entity_dxfattribs(
     layer_name_by_handle: dict[int, str] | None = None,
 ) -> dict[str, Any]:
     attribs: dict[str, Any] = {}
-    if isinstance(layer_name_by_handle, dict):
+    if layer_name_by_handle:
         layer_handle = dxf.get("layer_handle")
-        try:
-            layer_handle_int = int(layer_handle) if layer_handle is not None else None
-        except Exception:
-            layer_handle_int = None
-        if layer_handle_int is not None:
-            layer_name = layer_name_by_handle.get(layer_handle_int)
+        # Decoded layer handles are ints; only other values go through int().
+        if layer_handle is not None and type(layer_handle) is not int:
+            try:
+                layer_handle = int(layer_handle)
+            except Exception:
+                layer_handle = None
+        if layer_handle is not None:
+            layer_name = layer_name_by_handle.get(layer_handle)
             if isinstance(layer_name, str) and layer_name:
                 attribs["layer"] = layer_name
 
-    raw_color_index = dxf.get("color_index")
-    color = _to_valid_aci(raw_color_index)
-    if color is None and raw_color_index is None:
-        color = _to_valid_aci(dxf.get("resolved_color_index"))
+    color_key = (
+        dxf.get("color_index"),
+        dxf.get("resolved_color_index"),
+        dxf.get("true_color"),
+        dxf.get("resolved_true_color"),
+    )
+    try:
+        hash(color_key)
+    except TypeError:
+        # Unhashable raw values cannot be cached; resolve them directly.
+        color, true_color = _resolve_entity_colors.__wrapped__(*color_key)
+    else:
+        color, true_color = _resolve_entity_colors(*color_key)
     if color is not None:
         attribs["color"] = color
-
-    raw_true_color = dxf.get("true_color")
-    true_color = _to_valid_true_color(raw_true_color)
-    if true_color is None and raw_true_color is None:
-        true_color = _to_valid_true_color(dxf.get("resolved_true_color"))
     if true_color is not None:
         attribs["true_color"] = true_color
     return attribs
 
 
+@lru_cache(maxsize=4096)
+def _resolve_entity_colors(
+    raw_color_index: Any,
+    raw_resolved_color_index: Any,
+    raw_true_color: Any,
+    raw_resolved_true_color: Any,
+) -> tuple[int | None, int | None]:
+    # Drawings reuse a small set of color combinations, so the validated
+    # pair is cached by the raw decoded values.
+    color = _to_valid_aci(raw_color_index)
+    if color is None and raw_color_index is None:
+        color = _to_valid_aci(raw_resolved_color_index)
+    true_color = _to_valid_true_color(raw_true_color)
+    if true_color is None and raw_true_color is None:
+        true_color = _to_valid_true_color(raw_resolved_true_color)
+    return color, true_color
+
+
 def _anonymous_dimension_block_ref_key(
     block_name: str,
     insert: tuple[float, float, float],
@@ -5622,35 +5909,44 @@ def _anonymous_dimension_block_ref_key(
     yscale: float,
     zscale: float,
     rotation: float,
-) -> tuple[str, tuple[float, float, float], tuple[float, float, float], float] | None:
-    if not block_name.upper().startswith("*D"):
+) -> _DimensionBlockRefKey | None:
+    # Callers pass names from _normalize_block_name, so only case folding is
+    # needed. The quantized transform is packed into one bytes value so each
+    # set lookup hashes a single contiguous buffer.
+    upper_name = block_name.upper()
+    if not upper_name.startswith("*D"):
         return None
+    quantize = _quantize_dim_block_value
     return (
-        block_name.strip().upper(),
-        (
-            _quantize_dim_block_value(insert[0]),
-            _quantize_dim_block_value(insert[1]),
-            _quantize_dim_block_value(insert[2]),
-        ),
-        (
-            _quantize_dim_block_value(xscale),
-            _quantize_dim_block_value(yscale),
-            _quantize_dim_block_value(zscale),
+        upper_name,
+        _DIMENSION_BLOCK_REF_TRANSFORM.pack(
+            quantize(insert[0]),
+            quantize(insert[1]),
+            quantize(insert[2]),
+            quantize(xscale),
+            quantize(yscale),
+            quantize(zscale),
+            quantize(_normalized_angle_degrees(rotation)),
         ),
-        _quantize_dim_block_value(_normalized_angle_degrees(rotation)),
     )
 
 
 def _remember_written_dimension_block_reference(
     dimension_context: _DimensionWriteContext | None,
     dxf: dict[str, Any],
+    *,
+    block_name: str | None = None,
+    transform: tuple[tuple[float, float, float], float, float, float, float] | None = None,
 ) -> None:
     if dimension_context is None:
         return
-    block_name = _dimension_anonymous_block_name(dxf)
+    if block_name is None:
+        block_name = _dimension_anonymous_block_name(dxf)
     if block_name is None:
         return
-    insert, xscale, yscale, zscale, rotation = _dimension_block_reference_transform(dxf)
+    if transform is None:
+        transform = _dimension_block_reference_transform(dxf)
+    insert, xscale, yscale, zscale, rotation = transform
     key = _anonymous_dimension_block_ref_key(block_name, insert, xscale, yscale, zscale, rotation)
     if key is None:
         return
@@ -5675,7 +5971,7 @@ def _should_skip_anonymous_dimension_block_insert(
     )
     if is_empty:
         return True
-    if not block_name.upper().startswith("*D"):
+    if not _is_anonymous_dimension_block_name(block_name):
         return False
 
     normalized_policy = _normalize_dim_block_policy(dim_block_policy)
@@ -5755,7 +6051,7 @@ def _prepare_insert_for_flatten(modelspace: Any, insert: Any) -> bool:
     if is_empty:
         return True
 
-    if block_name.upper().startswith("*D"):
+    if _is_anonymous_dimension_block_name(block_name):
         if has_nested_dim_insert:
             return True
         if local_center_abs is not None and (
@@ -5835,10 +6131,7 @@ def _cached_block_insert_safety_info(
     if doc is None:
         return (False, False, None)
 
-    by_name = _BLOCK_INSERT_SAFETY_CACHE.get(doc)
-    if by_name is None:
-        by_name = {}
-        _BLOCK_INSERT_SAFETY_CACHE[doc] = by_name
+    by_name = _per_doc_cache(_BLOCK_INSERT_SAFETY_CACHE, doc)
     cached = by_name.get(block_name)
     if cached is not None:
         # Block layouts may be created first and populated later. Refresh
@@ -5871,67 +6164,86 @@ def _cached_block_insert_safety_info(
         by_name[block_name] = info
         return info
 
-    entities = list(block)
-    is_empty = len(entities) == 0
+    info = _block_insert_safety_info(block)
+    by_name[block_name] = info
+    return info
+
+
+def _prime_block_insert_safety_cache(doc: Any) -> None:
+    # Scan every exported block definition once so later INSERT/DIMENSION
+    # checks against the same document are plain dictionary lookups.
+    if doc is None:
+        return
+    try:
+        blocks = list(doc.blocks)
+    except Exception:
+        return
+    by_name = _per_doc_cache(_BLOCK_INSERT_SAFETY_CACHE, doc)
+    for block in blocks:
+        block_name = _normalize_block_name(getattr(block, "name", None))
+        if block_name is None or block_name in by_name:
+            continue
+        if _is_layout_pseudo_block_name(block_name):
+            # Layout blocks are still being written; resolve them lazily.
+            continue
+        try:
+            by_name[block_name] = _block_insert_safety_info(block)
+        except Exception:
+            continue
+
+
+def _block_insert_safety_info(block: Any) -> tuple[bool, bool, float | None]:
+    is_empty = True
     has_nested_dim_insert = False
-    local_center_abs: float | None = None
     min_x = math.inf
     min_y = math.inf
     max_x = -math.inf
     max_y = -math.inf
+    isfinite = math.isfinite
 
-    def _push_xy(x: Any, y: Any) -> None:
-        nonlocal min_x, min_y, max_x, max_y
-        try:
-            x_val = float(x)
-            y_val = float(y)
-        except Exception:
-            return
-        if not (math.isfinite(x_val) and math.isfinite(y_val)):
-            return
-        min_x = min(min_x, x_val)
-        min_y = min(min_y, y_val)
-        max_x = max(max_x, x_val)
-        max_y = max(max_y, y_val)
-
-    for entity in entities:
+    for entity in block:
+        is_empty = False
         dxftype = entity.dxftype()
         dxf = entity.dxf
-        if dxftype in {"INSERT", "MINSERT"}:
-            nested_name = _normalize_block_name(getattr(dxf, "name", None))
-            if nested_name is not None and nested_name.upper().startswith("*D"):
-                has_nested_dim_insert = True
-            _push_xy(getattr(dxf.insert, "x", 0.0), getattr(dxf.insert, "y", 0.0))
-            continue
-        if dxftype == "LINE":
-            _push_xy(getattr(dxf.start, "x", 0.0), getattr(dxf.start, "y", 0.0))
-            _push_xy(getattr(dxf.end, "x", 0.0), getattr(dxf.end, "y", 0.0))
-            continue
-        if dxftype == "POINT":
-            _push_xy(getattr(dxf.location, "x", 0.0), getattr(dxf.location, "y", 0.0))
-            continue
-        if dxftype in {"ARC", "CIRCLE"}:
-            _push_xy(getattr(dxf.center, "x", 0.0), getattr(dxf.center, "y", 0.0))
+        point_attributes = _BLOCK_EXTENT_POINT_ATTRIBUTES.get(dxftype)
+        try:
+            if point_attributes is not None:
+                if not has_nested_dim_insert and dxftype in {"INSERT", "MINSERT"}:
+                    nested_name = _normalize_block_name(getattr(dxf, "name", None))
+                    if nested_name is not None and _is_anonymous_dimension_block_name(nested_name):
+                        has_nested_dim_insert = True
+                points: Any = [getattr(dxf, name) for name in point_attributes]
+            elif dxftype == "LWPOLYLINE":
+                # Raw vertex rows avoid the per-call tuple formatting done by
+                # get_points("xy").
+                points = entity.lwpoints
+            else:
+                continue
+        except AttributeError:
             continue
-        if dxftype in {"TEXT", "MTEXT"}:
-            _push_xy(getattr(dxf.insert, "x", 0.0), getattr(dxf.insert, "y", 0.0))
+        try:
+            for point in points:
+                x_val = float(point[0])
+                y_val = float(point[1])
+                if not (isfinite(x_val) and isfinite(y_val)):
+                    continue
+                if x_val < min_x:
+                    min_x = x_val
+                if x_val > max_x:
+                    max_x = x_val
+                if y_val < min_y:
+                    min_y = y_val
+                if y_val > max_y:
+                    max_y = y_val
+        except Exception:
             continue
-        if dxftype == "LWPOLYLINE":
-            try:
-                for point in entity.get_points("xy"):
-                    if len(point) >= 2:
-                        _push_xy(point[0], point[1])
-            except Exception:
-                continue
 
-    if math.isfinite(min_x) and math.isfinite(min_y):
+    local_center_abs: float | None = None
+    if isfinite(min_x) and isfinite(min_y):
         center_x = (min_x + max_x) * 0.5
         center_y = (min_y + max_y) * 0.5
         local_center_abs = max(abs(center_x), abs(center_y))
-
-    info = (is_empty, has_nested_dim_insert, local_center_abs)
-    by_name[block_name] = info
-    return info
+    return (is_empty, has_nested_dim_insert, local_center_abs)
 
 
 def _cached_block_layout_metrics(
@@ -5942,10 +6254,7 @@ def _cached_block_layout_metrics(
     if doc is None:
         return (0, 0, None)
 
-    by_name = _BLOCK_LAYOUT_METRICS_CACHE.get(doc)
-    if by_name is None:
-        by_name = {}
-        _BLOCK_LAYOUT_METRICS_CACHE[doc] = by_name
+    by_name = _per_doc_cache(_BLOCK_LAYOUT_METRICS_CACHE, doc)
     cached = by_name.get(block_name)
     if cached is not None:
         return cached
@@ -5961,54 +6270,51 @@ def _cached_block_layout_metrics(
         by_name[block_name] = metrics
         return metrics
 
-    entities = list(block)
+    entity_count = 0
     nested_insert_count = 0
     min_x = math.inf
     min_y = math.inf
     max_x = -math.inf
     max_y = -math.inf
 
-    def _push_xy(x: Any, y: Any) -> None:
-        nonlocal min_x, min_y, max_x, max_y
-        try:
-            x_val = float(x)
-            y_val = float(y)
-        except Exception:
-            return
-        if not (math.isfinite(x_val) and math.isfinite(y_val)):
-            return
-        min_x = min(min_x, x_val)
-        min_y = min(min_y, y_val)
-        max_x = max(max_x, x_val)
-        max_y = max(max_y, y_val)
+    isfinite = math.isfinite
 
-    for entity in entities:
+    for entity in block:
+        entity_count += 1
         dxftype = _ezdxf_entity_type(entity)
         dxf = getattr(entity, "dxf", None)
-        if dxftype in {"INSERT", "MINSERT"} and dxf is not None:
-            nested_insert_count += 1
-            _push_xy(getattr(dxf.insert, "x", 0.0), getattr(dxf.insert, "y", 0.0))
-            continue
-        if dxftype == "LINE" and dxf is not None:
-            _push_xy(getattr(dxf.start, "x", 0.0), getattr(dxf.start, "y", 0.0))
-            _push_xy(getattr(dxf.end, "x", 0.0), getattr(dxf.end, "y", 0.0))
-            continue
-        if dxftype == "POINT" and dxf is not None:
-            _push_xy(getattr(dxf.location, "x", 0.0), getattr(dxf.location, "y", 0.0))
-            continue
-        if dxftype in {"ARC", "CIRCLE"} and dxf is not None:
-            _push_xy(getattr(dxf.center, "x", 0.0), getattr(dxf.center, "y", 0.0))
-            continue
-        if dxftype in {"TEXT", "MTEXT"} and dxf is not None:
-            _push_xy(getattr(dxf.insert, "x", 0.0), getattr(dxf.insert, "y", 0.0))
-            continue
         if dxftype == "LWPOLYLINE":
             try:
-                for point in entity.get_points("xy"):
-                    if len(point) >= 2:
-                        _push_xy(point[0], point[1])
+                points: Any = [point for point in entity.get_points("xy") if len(point) >= 2]
+            except Exception:
+                continue
+        else:
+            point_attributes = _BLOCK_EXTENT_POINT_ATTRIBUTES.get(dxftype)
+            if point_attributes is None or dxf is None:
+                continue
+            if dxftype in {"INSERT", "MINSERT"}:
+                nested_insert_count += 1
+            points = [getattr(dxf, name) for name in point_attributes]
+        for point in points:
+            if isinstance(point, tuple):
+                x, y = point[0], point[1]
+            else:
+                x, y = getattr(point, "x", 0.0), getattr(point, "y", 0.0)
+            try:
+                x_val = float(x)
+                y_val = float(y)
             except Exception:
                 continue
+            if not (isfinite(x_val) and isfinite(y_val)):
+                continue
+            if x_val < min_x:
+                min_x = x_val
+            if x_val > max_x:
+                max_x = x_val
+            if y_val < min_y:
+                min_y = y_val
+            if y_val > max_y:
+                max_y = y_val
 
     local_center_abs = None
     if math.isfinite(min_x) and math.isfinite(min_y):
@@ -6016,7 +6322,7 @@ def _cached_block_layout_metrics(
         center_y = (min_y + max_y) * 0.5
         local_center_abs = max(abs(center_x), abs(center_y))
 
-    metrics = (len(entities), nested_insert_count, local_center_abs)
+    metrics = (entity_count, nested_insert_count, local_center_abs)
     by_name[block_name] = metrics
     return metrics
 
@@ -6268,7 +6574,7 @@ def _prune_implausible_entities_from_repeated_large_blocks(modelspace: Any) -> N
         block_name = _normalize_block_name(getattr(dxf, "name", None))
         if block_name is None:
             continue
-        if _is_layout_pseudo_block_name(block_name) or block_name.upper().startswith("*D"):
+        if _is_layout_pseudo_block_name(block_name) or _is_anonymous_dimension_block_name(block_name):
             continue
         by_name.setdefault(block_name, []).append(insert)
 
@@ -6302,9 +6608,9 @@ def _prune_implausible_entities_from_repeated_large_blocks(modelspace: Any) -> N
                 continue
 
     if pruned_any:
-        _BLOCK_INSERT_SAFETY_CACHE.pop(doc, None)
-        _BLOCK_LAYOUT_METRICS_CACHE.pop(doc, None)
-        _BLOCK_LOCAL_Y_SPAN_CACHE.pop(doc, None)
+        _discard_per_doc_cache(_BLOCK_INSERT_SAFETY_CACHE, doc)
+        _discard_per_doc_cache(_BLOCK_LAYOUT_METRICS_CACHE, doc)
+        _discard_per_doc_cache(_BLOCK_LOCAL_Y_SPAN_CACHE, doc)
 
 
 def _drop_pathological_modelspace_block_references(modelspace: Any) -> None:
@@ -6326,7 +6632,7 @@ def _drop_pathological_modelspace_block_references(modelspace: Any) -> None:
         block_name = _normalize_block_name(getattr(dxf, "name", None))
         if block_name is None:
             continue
-        if _is_layout_pseudo_block_name(block_name) or block_name.upper().startswith("*D"):
+        if _is_layout_pseudo_block_name(block_name) or _is_anonymous_dimension_block_name(block_name):
             continue
         by_name.setdefault(block_name, []).append(insert)
 
@@ -6363,10 +6669,13 @@ def _is_placeholder_anonymous_dimension_insert(
     zscale: float,
     rotation: float,
 ) -> bool:
-    if not block_name.upper().startswith("*D"):
+    if not _is_anonymous_dimension_block_name(block_name):
         return False
     near_zero = 1.0e-9
-    if (
+    # Real inserts almost always fail on the first coordinate, so the
+    # short-circuiting chain is cheaper than reducing all seven terms with
+    # max(), which would also let a NaN term slip through.
+    return (
         abs(insert[0]) <= near_zero
         and abs(insert[1]) <= near_zero
         and abs(insert[2]) <= near_zero
@@ -6374,9 +6683,7 @@ def _is_placeholder_anonymous_dimension_insert(
         and abs(yscale - 1.0) <= near_zero
         and abs(zscale - 1.0) <= near_zero
         and abs(rotation) <= near_zero
-    ):
-        return True
-    return False
+    )
 
 
 def _normalize_layout_pseudo_insert_transform(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import fnmatch
 import math
 import re
+import sys
 from functools import lru_cache
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Iterator
@@ -2260,7 +2261,9 @@ def _normalize_types(types: str | Iterable[str] | None, path: str | None = None)
         if token in SUPPORTED_ENTITY_TYPES:
             if token not in seen:
                 seen.add(token)
-                selected.append(token)
+                # Entities carry this string as their dxftype; interning it
+                # lets the per-entity type dispatch dicts match by identity.
+                selected.append(sys.intern(token))
 
     return selected
 
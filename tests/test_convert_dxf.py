@@ -2135,6 +2135,8 @@ def test_entities_by_handle_skips_invalid_handles_and_iteration_errors() -> None
 
         def query(self, dxftype: str):
             self.calls.append(dxftype)
+            if " " in dxftype:
+                raise RuntimeError("multi-type query unsupported")
             if dxftype == "ARC":
                 def arc_iter():
                     yield Entity(dxftype="ARC", handle=0x200, dxf={})
@@ -2156,11 +2158,32 @@ def test_entities_by_handle_skips_invalid_handles_and_iteration_errors() -> None
     layout = DummyLayout()
     entities_by_handle = convert_module._entities_by_handle(layout, {"LINE", "ARC", "CIRCLE"})
 
-    assert layout.calls == ["ARC", "CIRCLE", "LINE"]
+    assert layout.calls == ["ARC CIRCLE LINE", "ARC", "CIRCLE", "LINE"]
     assert sorted(entities_by_handle) == [0x100, 0x101, 0x200]
     assert entities_by_handle[0x200].dxftype == "ARC"
 
 
+def test_entities_by_handle_queries_all_types_at_once() -> None:
+    class DummyLayout:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def query(self, types: str, include_styles: bool = True):
+            self.calls.append(types)
+            return iter(
+                [
+                    Entity(dxftype="ARC", handle=0x200, dxf={}),
+                    Entity(dxftype="LINE", handle=0x100, dxf={}),
+                ]
+            )
+
+    layout = DummyLayout()
+    entities_by_handle = convert_module._entities_by_handle(layout, {"LINE", "ARC"})
+
+    assert layout.calls == ["ARC LINE"]
+    assert sorted(entities_by_handle) == [0x100, 0x200]
+
+
 def test_collect_referenced_block_names_trims_insert_names() -> None:
     block_members_by_name = {
         "BLK_A": [(10, "INSERT"), (11, "LINE")],
@@ -3143,9 +3166,10 @@ def test_entities_by_handle_and_type_keeps_duplicate_handles_by_dxftype() -> Non
                 ]
             return []
 
-    result = convert_module._entities_by_handle_and_type_multi(
+    result = convert_module._entities_by_handle_and_type_multi_impl(
         _DummyLayout(),
         {"LINE", "TEXT"},
+        include_styles=True,
     )
 
     assert (42, "LINE") in result
@@ -3572,6 +3596,101 @@ def test_prune_implausible_entities_from_repeated_large_blocks() -> None:
     assert type_counts.get("3DFACE", 0) == 0
 
 
+def test_prime_block_insert_safety_cache_matches_lazy_scan() -> None:
+    pytest.importorskip("ezdxf")
+
+    ezdxf = convert_module._require_ezdxf()
+    doc = ezdxf.new(dxfversion="R2010")
+    msp = doc.modelspace()
+
+    detail = doc.blocks.new(name="DETAIL")
+    detail.add_line((5000.0, 0.0), (5010.0, 0.0))
+    detail.add_lwpolyline([(5000.0, 10.0), (5020.0, 30.0)])
+    detail.add_blockref("*D1", (5005.0, 5.0))
+    doc.blocks.new(name="EMPTY")
+    msp.add_line((0.0, 0.0), (1.0, 1.0))
+
+    convert_module._prime_block_insert_safety_cache(doc)
+    primed = dict(convert_module._BLOCK_INSERT_SAFETY_CACHE[doc])
+    assert primed["DETAIL"] == (False, True, 5010.0)
+    assert primed["EMPTY"] == (True, False, None)
+    assert not any(convert_module._is_layout_pseudo_block_name(name) for name in primed)
+
+    convert_module._BLOCK_INSERT_SAFETY_CACHE.pop(doc, None)
+    assert convert_module._cached_block_insert_safety_info(msp, "DETAIL") == primed["DETAIL"]
+
+
+def test_block_insert_safety_info_uses_finite_lwpolyline_bounds() -> None:
+    pytest.importorskip("ezdxf")
+
+    ezdxf = convert_module._require_ezdxf()
+    doc = ezdxf.new(dxfversion="R2010")
+    points = [(2000.0 + float(index), float(index % 7)) for index in range(64)]
+    points.append((math.nan, 0.0))
+
+    long_block = doc.blocks.new(name="LONG")
+    long_block.add_lwpolyline(points)
+    short_block = doc.blocks.new(name="SHORT")
+    short_block.add_lwpolyline([points[0], points[-2]])
+
+    assert convert_module._block_insert_safety_info(long_block) == (False, False, 2031.5)
+    assert convert_module._block_insert_safety_info(short_block) == (False, False, 2031.5)
+
+
+def test_cached_block_insert_safety_info_accepts_non_weakrefable_doc() -> None:
+    pytest.importorskip("ezdxf")
+
+    ezdxf = convert_module._require_ezdxf()
+    doc = ezdxf.new(dxfversion="R2010")
+    doc.blocks.new(name="DETAIL").add_line((0.0, 0.0), (10.0, 0.0))
+
+    class _SlotsDoc:
+        __slots__ = ("blocks",)
+
+        def __init__(self, blocks: Any) -> None:
+            self.blocks = blocks
+
+    class _Layout:
+        def __init__(self, owner: Any) -> None:
+            self.doc = owner
+
+    layout = _Layout(_SlotsDoc(doc.blocks))
+    assert convert_module._cached_block_insert_safety_info(layout, "DETAIL") == (
+        False,
+        False,
+        5.0,
+    )
+
+
+def test_object_header_rows_are_decoded_and_normalized_once_per_conversion(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def _fake_headers(path: str) -> list[tuple[Any, ...]]:
+        calls.append(path)
+        return [
+            (102, 12, 0, 0x05, " endblk ", "Entity"),
+            (100, 10, 0, 0x04, "BLOCK", "E"),
+            (101, 11, 0, 0x13, "line", "entity"),
+            (300, 5, 0, 0x30, "LAYER", "Object"),
+            ("bad", 13, 0, 0x13, "LINE", "Entity"),
+        ]
+
+    monkeypatch.setattr(convert_module.raw, "list_object_headers_with_type", _fake_headers)
+    decode_cache = convert_module._ConvertDecodeCache()
+
+    rows = convert_module._decode_object_header_rows("dummy.dwg", decode_cache=decode_cache)
+    assert rows is not None
+    entity_rows = convert_module._entity_header_rows(rows, decode_cache=decode_cache)
+    assert entity_rows == [(100, 10, "BLOCK"), (101, 11, "LINE"), (102, 12, "ENDBLK")]
+
+    again = convert_module._decode_object_header_rows("dummy.dwg", decode_cache=decode_cache)
+    assert again is rows
+    assert convert_module._entity_header_rows(again, decode_cache=decode_cache) is entity_rows
+    assert calls == ["dummy.dwg"]
+
+
 def test_drop_implausible_modelspace_primitives_removes_tiny_origin_geometry() -> None:
     pytest.importorskip("ezdxf")
 
@@ -4106,6 +4225,127 @@ def test_write_dimension_native_placeholder_prefers_block_fallback() -> None:
     assert inserts[0].dxf.name == "*D2"
 
 
+def test_write_hatch_skips_hatch_without_usable_boundaries() -> None:
+    ezdxf = pytest.importorskip("ezdxf")
+
+    doc = ezdxf.new(dxfversion="R2010")
+    modelspace = doc.modelspace()
+
+    written = convert_module._write_hatch(
+        modelspace,
+        {
+            "solid_fill": True,
+            "paths": [
+                "not-a-path",
+                None,
+                {"points": [(0.0, 0.0)], "closed": True},
+                {"points": [], "closed": True},
+            ],
+        },
+        {},
+    )
+
+    assert written is False
+    assert len(modelspace.query("HATCH")) == 0
+
+
+def test_write_hatch_adds_only_usable_boundaries() -> None:
+    ezdxf = pytest.importorskip("ezdxf")
+
+    doc = ezdxf.new(dxfversion="R2010")
+    modelspace = doc.modelspace()
+
+    written = convert_module._write_hatch(
+        modelspace,
+        {
+            "solid_fill": True,
+            "paths": [
+                "not-a-path",
+                {"points": [(0.0, 0.0)], "closed": True},
+                {"points": [(0.0, 0.0), (4.0, 0.0), (4.0, 3.0)], "closed": True},
+            ],
+        },
+        {},
+    )
+
+    assert written is True
+    hatches = list(modelspace.query("HATCH"))
+    assert len(hatches) == 1
+    paths = list(hatches[0].paths)
+    assert len(paths) == 1
+    assert [tuple(vertex[:2]) for vertex in paths[0].vertices] == [
+        (0.0, 0.0),
+        (4.0, 0.0),
+        (4.0, 3.0),
+    ]
+    assert paths[0].is_closed
+
+
+def test_finalize_dimension_rolls_back_clones_when_virtual_entities_fail() -> None:
+    ezdxf = pytest.importorskip("ezdxf")
+    from ezdxf.entities import Line
+
+    doc = ezdxf.new(dxfversion="R2010")
+    modelspace = doc.modelspace()
+    dim = modelspace.add_linear_dim(base=(0.0, 5.0), p1=(0.0, 0.0), p2=(10.0, 0.0))
+    dimension = dim.dimension
+
+    def failing_virtual_entities():
+        yield Line.new(dxfattribs={"start": (0.0, 0.0, 0.0), "end": (1.0, 0.0, 0.0)})
+        raise RuntimeError("virtual entity generation failed")
+
+    dimension.virtual_entities = failing_virtual_entities
+
+    written = convert_module._finalize_dimension(
+        modelspace,
+        dim,
+        dxfattribs={"color": 3},
+        explode_dimensions=True,
+    )
+
+    assert written is True
+    assert len(modelspace.query("LINE")) == 0
+    assert list(modelspace.query("DIMENSION")) == [dimension]
+
+
+def test_entity_dxfattribs_resolves_unhashable_colors_without_cache() -> None:
+    dxf = {
+        "color_index": [5],
+        "resolved_color_index": 3,
+        "true_color": 0x123456,
+        "resolved_true_color": [0xABCDEF],
+    }
+    expected_color, expected_true_color = convert_module._resolve_entity_colors.__wrapped__(
+        [5],
+        3,
+        0x123456,
+        [0xABCDEF],
+    )
+    cache_before = convert_module._resolve_entity_colors.cache_info()
+
+    attribs = convert_module._entity_dxfattribs(dxf)
+
+    assert expected_color is None
+    assert expected_true_color == 0x123456
+    assert attribs == {"true_color": 0x123456}
+    cache_after = convert_module._resolve_entity_colors.cache_info()
+    assert cache_after.hits == cache_before.hits
+    assert cache_after.misses == cache_before.misses
+
+
+def test_entity_dxfattribs_cached_colors_match_uncached_path() -> None:
+    dxf = {"color_index": None, "resolved_color_index": 3, "true_color": 0x1123456}
+
+    attribs = convert_module._entity_dxfattribs(dxf)
+
+    assert attribs == {"color": 3, "true_color": 0x123456}
+    assert convert_module._entity_dxfattribs(dxf) == attribs
+    assert convert_module._resolve_entity_colors.__wrapped__(None, 3, 0x1123456, None) == (
+        3,
+        0x123456,
+    )
+
+
 def test_write_insert_skips_anonymous_dimension_insert_after_dimension_success() -> None:
     ezdxf = pytest.importorskip("ezdxf")
 
@@ -6,6 +6,7 @@ import pytest
 
 import ezdwg
 import ezdwg.cli as cli_module
+import ezdwg.convert as convert_module
 import ezdwg.document as document_module
 
 
@@ -135,6 +136,21 @@ def test_to_dwg_writes_ray_and_xline_from_document(monkeypatch, tmp_path: Path)
     assert xlines[0].dxf["unit_vector"] == (0.0, 1.0, 0.0)
 
 
+def test_resolve_dwg_export_entities_skips_query_without_writable_types(monkeypatch) -> None:
+    monkeypatch.setattr(convert_module, "_present_supported_types", lambda _path: ("HATCH",))
+
+    class _Doc:
+        decode_path = "dummy_no_writable.dwg"
+
+    class _Layout:
+        doc = _Doc()
+
+        def query(self, *_args, **_kwargs):
+            raise AssertionError("query() must not run without writable types")
+
+    assert convert_module._resolve_dwg_export_entities(_Layout(), None) == []
+
+
 def test_to_dwg_writes_line_from_source_sample(tmp_path: Path) -> None:
     source = SAMPLES / "line_2000.dwg"
     output = tmp_path / "line_2000_written.dwg"